@@ -2,5 +2,3 @@
 from .scheduler import SchedulingSimulator
 
 __all__ = ['SchedulingSimulator']
-
-
@@ -1,77 +1,257 @@
 """Base Algorithm Interface"""
 from abc import ABC, abstractmethod
-from typing import List, Dict
-from models.process import Process
+from typing import Iterator, List, Dict, Optional, Tuple
+from models.gantt_trace import GanttTrace
+from models.process_table import ProcessTable, Workload, workload_pids
+from models.process_results import ProcessResults
+from .checkpoint import Checkpoint, find_checkpoint
+from .kernel import ReadyQueuePolicy, SimulationKernel
+
+try:
+    import numpy as np
+except ImportError:  # Optional - metrics fall back to plain Python reductions
+    np = None
+
+PERCENTILES = (50, 90, 99)
 
 
 class BaseAlgorithm(ABC):
     """Base class for all scheduling algorithms"""
     
     @abstractmethod
-    def execute(self, processes: List[Process], **kwargs) -> Dict:
+    def execute(self, processes: Workload, **kwargs) -> Dict:
         """
         Execute the scheduling algorithm
         
         Args:
-            processes: List of processes to schedule
+            processes: Processes to schedule, as a list or a ProcessTable
             **kwargs: Additional algorithm-specific parameters
-            
+        
         Returns:
             Dictionary with algorithm results
         """
         pass
     
-    def calculate_results(self, algorithm_name: str, processes: List[Process], 
-                         gantt: List[dict], total_time: int, total_idle: int) -> dict:
+    def build_policy(self, **kwargs) -> Tuple[str, ReadyQueuePolicy]:
         """
-        Calculate and format results for an algorithm
+        Algorithm name and ready-queue policy for the given parameters
+        
+        Args:
+            **kwargs: Algorithm-specific parameters, as accepted by execute()
+        
+        Returns:
+            Tuple of (algorithm name, policy)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not provide a kernel policy")
+    
+    def iter_schedule(self, processes: Workload, n_cpus: int = 1, per_core_queues: bool = False,
+                      coalesce: bool = True, **kwargs) -> Iterator[Tuple[str, dict]]:
+        """
+        Run the algorithm as a stream of records instead of one results dict
+        
+        Yields ("segment", ...) and ("completion", ...) records as the kernel
+        decides them (see SimulationKernel.stream), then one ("summary",
+        {"algorithm", "total_time", "metrics"}) record. The Gantt chart is not
+        kept, so memory does not grow with the length of the trace.
+        
+        Args:
+            processes: Processes to schedule, as a list or a ProcessTable
+            n_cpus: Number of simulated CPU cores
+            per_core_queues: Give each core its own ready queue instead of a shared one
+            coalesce: Merge back-to-back segments of the same process
+            **kwargs: Algorithm-specific parameters, as accepted by execute()
+        
+        Returns:
+            Iterator of (kind, record) pairs
+        """
+        algorithm_name, policy = self.build_policy(**kwargs)
+        kernel = SimulationKernel(policy, n_cpus, per_core_queues, coalesce)
+        return self._stream(algorithm_name, kernel, processes)
+    
+    def _stream(self, algorithm_name: str, kernel: SimulationKernel,
+                processes: Workload) -> Iterator[Tuple[str, dict]]:
+        yield from kernel.stream(processes)
+        results = self.calculate_results(algorithm_name, processes, GanttTrace(), kernel.total_time,
+                                         kernel.total_idle, kernel.n_cpus, kernel.pid_order)
+        yield "summary", {
+            "algorithm": algorithm_name,
+            "total_time": kernel.total_time,
+            "metrics": results["metrics"]
+        }
+    
+    def resimulate(self, previous: dict, processes: Workload, n_cpus: int = 1,
+                   per_core_queues: bool = False, coalesce: bool = True, **kwargs) -> dict:
+        """
+        Run the algorithm on a changed workload, reusing an earlier run
+        
+        The schedule of `previous` is kept up to its last idle point before
+        the earliest added, removed or changed process (see checkpoint.py)
+        and only the rest is simulated. Falls back to execute() when no
+        such point exists. The results equal those of execute().
+        
+        Args:
+            previous: Results of this algorithm, with the same parameters and
+                options, on the workload before the change
+            processes: The changed workload, as a list or a ProcessTable
+            n_cpus: Number of simulated CPU cores
+            per_core_queues: Give each core its own ready queue instead of a shared one
+            coalesce: Merge back-to-back segments of the same process
+            **kwargs: Algorithm-specific parameters, as accepted by execute()
+        
+        Returns:
+            Formatted results dictionary
+        """
+        algorithm_name, policy = self.build_policy(**kwargs)
+        checkpoint = find_checkpoint(previous, processes, policy, n_cpus)
+        if checkpoint is None:
+            return self.execute(processes, n_cpus=n_cpus, per_core_queues=per_core_queues,
+                                coalesce=coalesce, **kwargs)
+        return self.simulate(algorithm_name, policy, processes, n_cpus, per_core_queues, coalesce,
+                             checkpoint)
+    
+    def simulate(self, algorithm_name: str, policy: ReadyQueuePolicy, processes: Workload,
+                 n_cpus: int = 1, per_core_queues: bool = False, coalesce: bool = True,
+                 checkpoint: Optional[Checkpoint] = None, include_gantt: bool = True) -> dict:
+        """
+        Run a ready-queue policy on the simulation kernel and format the results
+        
+        With several CPUs the results also carry "n_cpus" and a "cores" list
+        holding each core's Gantt lane and utilization. Without include_gantt
+        the Gantt charts are left empty and the results carry "total_time"
+        and "dispatches" instead.
         
         Args:
             algorithm_name: Name of the algorithm
-            processes: List of scheduled processes
-            gantt: Gantt chart data
-            total_time: Total execution time
-            total_idle: Total idle time
+            policy: Ready-queue policy to run
+            processes: Processes to schedule, as a list or a ProcessTable
+            n_cpus: Number of simulated CPU cores
+            per_core_queues: Give each core its own ready queue instead of a shared one
+            coalesce: Merge back-to-back segments of the same process
+            checkpoint: Start from this point of an earlier run (see resimulate)
+            include_gantt: Build the Gantt chart; only dispatches are counted otherwise
             
         Returns:
             Formatted results dictionary
         """
-        from utils.pid_utils import pid_key
-        
-        if not processes:
-            return {
-                "algorithm": algorithm_name,
-                "gantt_chart": gantt,
-                "processes": [],
-                "metrics": {
-                    "avg_turnaround_time": 0.0,
-                    "avg_waiting_time": 0.0,
-                    "cpu_utilization": 0.0
+        kernel = SimulationKernel(policy, n_cpus, per_core_queues, coalesce, include_gantt)
+        gantt, total_time, total_idle = kernel.run(processes, checkpoint)
+        results = self.calculate_results(algorithm_name, processes, gantt, total_time, total_idle,
+                                         n_cpus, kernel.pid_order)
+        if not include_gantt:
+            results["total_time"] = total_time
+            results["dispatches"] = kernel.dispatches
+        
+        if n_cpus > 1:
+            results["n_cpus"] = n_cpus
+            results["cores"] = [
+                {
+                    "core": core,
+                    "gantt_chart": lane if include_gantt else GanttTrace(),
+                    "cpu_utilization": round(busy / total_time * 100, 2) if total_time > 0 else 0.0
                 }
-            }
+                for core, (lane, busy) in enumerate(zip(kernel.lanes, kernel.core_busy))
+            ]
+        return results
+    
+    def calculate_results(self, algorithm_name: str, processes: Workload,
+                         gantt: List[dict], total_time: int, total_idle: int,
+                         n_cpus: int = 1, pid_order: Optional[List[int]] = None) -> dict:
+        """
+        Calculate and format results for an algorithm
         
-        avg_turnaround = sum(p.turnaround_time for p in processes) / len(processes)
-        avg_waiting = sum(p.waiting_time for p in processes) / len(processes)
+        Per-process results are returned as a columnar ProcessResults; the
+        metrics add min/max and percentile waiting and turnaround times.
         
-        if total_time > 0:
-            cpu_utilization = (total_time - total_idle) / total_time * 100
+        Args:
+            algorithm_name: Name of the algorithm
+            processes: Scheduled processes, as a list or a ProcessTable
+            gantt: Gantt chart data
+            total_time: Total execution time
+            total_idle: Total idle time, summed over CPUs
+            n_cpus: Number of CPUs the idle time was measured over
+            pid_order: Process indices in natural PID order, if already known
+        
+        Returns:
+            Formatted results dictionary
+        """
+        n = len(processes)
+        table = processes if isinstance(processes, ProcessTable) else None
+        if np is not None and n:
+            if table is not None:
+                names, name_rank = table.names, table.name_rank
+                pid_index = np.frombuffer(table.pid_index, dtype=np.int64)
+            else:
+                names, pid_index, name_rank = workload_pids(processes)
+                pid_index = np.array(pid_index, dtype=np.int64)
+            if pid_order is None:
+                pid_order = np.argsort(np.frombuffer(name_rank, dtype=np.int64)[pid_index], kind="stable")
+            pid_column = np.array(names, dtype=object)[pid_index[pid_order]].tolist()
         else:
-            cpu_utilization = 0.0
+            names, pid_index, name_rank = workload_pids(processes)
+            if pid_order is None:
+                pid_order = sorted(range(n), key=lambda i: name_rank[pid_index[i]])
+            pid_column = [names[pid_index[i]] for i in pid_order]
+        
+        columns = {"pid": pid_column}
+        for field in ProcessResults.FIELDS[1:]:
+            if table is not None:
+                column = getattr(table, ProcessTable.FIELDS[field])
+                if np is not None:
+                    columns[field] = np.frombuffer(column, dtype=np.int64)[pid_order] if n else np.zeros(0, np.int64)
+                else:
+                    columns[field] = [column[i] for i in pid_order]
+                continue
+            values = [getattr(processes[i], field) for i in pid_order]
+            columns[field] = np.array(values, dtype=np.int64) if np is not None else values
         
-        process_results = [
-            p.to_dict()
-            for p in sorted(processes, key=lambda x: pid_key(x.pid))
-        ]
+        metrics = {
+            "avg_turnaround_time": 0.0,
+            "avg_waiting_time": 0.0,
+            "cpu_utilization": 0.0
+        }
+        if n and total_time > 0:
+            capacity = total_time * n_cpus
+            metrics["cpu_utilization"] = round((capacity - total_idle) / capacity * 100, 2)
+        for field in ("turnaround_time", "waiting_time"):
+            metrics.update(_distribution(field, columns[field]))
         
         return {
             "algorithm": algorithm_name,
             "gantt_chart": gantt,
-            "processes": process_results,
-            "metrics": {
-                "avg_turnaround_time": round(avg_turnaround, 2),
-                "avg_waiting_time": round(avg_waiting, 2),
-                "cpu_utilization": round(cpu_utilization, 2)
-            }
+            "processes": ProcessResults(columns),
+            "metrics": metrics
         }
 
 
+def _percentiles(values: list, quantiles: Tuple[float, ...]) -> List[float]:
+    """Linearly interpolated percentiles of a list, as numpy.percentile computes them"""
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    result = []
+    for q in quantiles:
+        position = last * q / 100
+        low = int(position)
+        high = min(low + 1, last)
+        result.append(ordered[low] + (ordered[high] - ordered[low]) * (position - low))
+    return result
+
+
+def _distribution(field: str, column) -> Dict[str, float]:
+    """Average, min, max and percentile metrics for one per-process column (all 0 if empty)"""
+    if not len(column):
+        total = low = high = 0
+        p50 = p90 = p99 = 0.0
+    elif np is not None:
+        total, low, high = int(column.sum()), int(column.min()), int(column.max())
+        p50, p90, p99 = np.percentile(column, PERCENTILES).tolist()
+    else:
+        total, low, high = sum(column), min(column), max(column)
+        p50, p90, p99 = _percentiles(column, PERCENTILES)
+    return {
+        f"avg_{field}": round(total / len(column), 2) if len(column) else 0.0,
+        f"min_{field}": low,
+        f"max_{field}": high,
+        f"p50_{field}": round(p50, 2),
+        f"p90_{field}": round(p90, 2),
+        f"p99_{field}": round(p99, 2)
+    }
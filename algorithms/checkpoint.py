@@ -0,0 +1,93 @@
+"""Resume Points for Incremental Re-Simulation"""
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, List, NamedTuple, Optional
+from models.gantt_trace import GanttTrace
+from models.process_table import Workload, workload_columns
+from .kernel import ReadyQueuePolicy
+
+
+class Checkpoint(NamedTuple):
+    """
+    Idle point of an earlier run that a new run can start from
+    
+    Every job arriving before `time` had finished by then, so the CPUs and
+    ready queues were empty and the rest of the schedule cannot depend on
+    how those jobs ran. The kernel takes their finish times and Gantt
+    lanes as given and only simulates the jobs arriving from `time` on.
+    """
+    time: float
+    finish: Dict[int, int]      # row of the new workload -> finish time
+    lanes: List[GanttTrace]     # per-core Gantt lane up to the checkpoint
+
+
+def find_checkpoint(previous: dict, processes: Workload, policy: ReadyQueuePolicy,
+                    n_cpus: int = 1) -> Optional[Checkpoint]:
+    """
+    Latest checkpoint of a previous run that is still valid for a changed workload
+    
+    Processes are matched by PID. The earliest affected time is the
+    smallest arrival time of any added, removed or changed process (old and
+    new values both count); the checkpoint is the latest idle point of the
+    previous schedule at or before it.
+    
+    Args:
+        previous: Results of the previous run, with the same policy and options
+        processes: The changed workload
+        policy: Ready-queue policy of the new run
+        n_cpus: Number of simulated CPU cores
+    
+    Returns:
+        Checkpoint to pass to SimulationKernel.run, or None if the run has
+        to start from scratch
+    """
+    if not policy.resumable or previous.get("n_cpus", 1) != n_cpus:
+        return None
+    old = {
+        field: column.tolist() if hasattr(column, "tolist") else list(column)
+        for field, column in previous["processes"].columns.items()
+    }
+    pids, arrival, burst, priority = workload_columns(processes)
+    if len(set(old["pid"])) != len(old["pid"]) or len(set(pids)) != len(pids):
+        # Matching needs unique PIDs
+        return None
+    columns = {"arrival": (old["arrival_time"], arrival),
+               "burst": (old["burst_time"], burst),
+               "priority": (old["priority"], priority)}
+    for name in policy.workload_ranges:
+        before, after = columns[name]
+        if min(before, default=0) != min(after, default=0) or max(before, default=0) != max(after, default=0):
+            return None
+    
+    # A changed process shows up on both sides, with its old and new arrival time
+    old_rows = zip(old["pid"], old["arrival_time"], old["burst_time"], old["priority"])
+    changed = set(old_rows).symmetric_difference(zip(pids, arrival, burst, priority))
+    limit = min((row[1] for row in changed), default=float('inf'))
+    
+    # Latest time <= limit by which every earlier arrival had finished
+    order = sorted(range(len(old["pid"])), key=old["arrival_time"].__getitem__)
+    old_arrival = [old["arrival_time"][row] for row in order]
+    latest = [0, *accumulate(map(old["finish_time"].__getitem__, order), max)]
+    time = limit
+    position = bisect_left(old_arrival, time)
+    while position and latest[position] > time:
+        time = old_arrival[position - 1]
+        position = bisect_left(old_arrival, time, 0, position)
+    if position == 0:
+        return None
+    
+    lanes = [previous["gantt_chart"]] if n_cpus == 1 else [core["gantt_chart"] for core in previous["cores"]]
+    prefix = []
+    for lane in lanes:
+        if not isinstance(lane, GanttTrace):
+            return None
+        end = bisect_left(lane.starts, time)
+        while end and lane.pid_index[end - 1] == 0:
+            end -= 1
+        prefix.append(lane[:end])
+    if sum(len(lane) for lane in prefix) == 0:
+        # E.g. a run made without its Gantt chart
+        return None
+    
+    finish = dict(zip(old["pid"], old["finish_time"]))
+    return Checkpoint(time, {row: finish[pid] for row, pid in enumerate(pids) if arrival[row] < time}, prefix)
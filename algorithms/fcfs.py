@@ -1,49 +1,186 @@
 """First Come First Served Algorithm"""
-from typing import List, Dict
-from models.process import Process
-from utils.pid_utils import pid_key
+from collections import deque
+from typing import List, Dict, Optional, Tuple
+from models.gantt_trace import GanttTrace
+from models.process_table import ProcessTable, Workload, store_schedule, workload_pids, workload_times
 from .base_algorithm import BaseAlgorithm
+from .kernel import ReadyQueuePolicy, SimulationKernel
+
+try:
+    import numpy as np
+except ImportError:  # Optional - the kernel path needs only the standard library
+    np = None
+
+
+class FCFSPolicy(ReadyQueuePolicy):
+    """FIFO ready queue; the arrival stream already orders by arrival, then PID"""
+    
+    def bind(self, kernel: SimulationKernel) -> None:
+        super().bind(kernel)
+        self.queue = deque()
+    
+    def push(self, job: int, now: int) -> None:
+        self.queue.append(job)
+    
+    def push_many(self, jobs: List[int], now: int) -> None:
+        self.queue.extend(jobs)
+    
+    def pop(self, now: int) -> int:
+        return self.queue.popleft()
+    
+    def __len__(self) -> int:
+        return len(self.queue)
+
+
+def fcfs_closed_form(processes: Workload, include_gantt: bool = True) -> Tuple[GanttTrace, int, int]:
+    """
+    Single-CPU FCFS as a vectorized prefix scan (requires NumPy)
+    
+    finish[i] = max(finish[i-1], arrival[i]) + burst[i] unrolls to
+    cumsum(burst)[i] + running max of (arrival[j] - cumsum(burst)[j-1]),
+    so the whole schedule is a handful of array passes. Every job runs in
+    one piece, so there is nothing to coalesce.
+    
+    Args:
+        processes: Processes to schedule, as a list or a ProcessTable; times are written back
+        include_gantt: Fill in the Gantt chart (left empty otherwise)
+    
+    Returns:
+        Tuple of (gantt chart, total time, total idle time)
+    """
+    n = len(processes)
+    if n == 0:
+        return GanttTrace(), 0, 0
+    table = processes if isinstance(processes, ProcessTable) else None
+    if table is not None:
+        names, name_rank = table.names, table.name_rank
+        pid_index = np.frombuffer(table.pid_index, dtype=np.int64)
+        arrival = np.frombuffer(table.arrival, dtype=np.int64)
+        burst = np.frombuffer(table.burst, dtype=np.int64)
+    else:
+        names, pid_index, name_rank = workload_pids(processes)
+        arrival, burst, _ = workload_times(processes)
+        pid_index = np.array(pid_index, dtype=np.int64)
+        arrival = np.array(arrival, dtype=np.int64)
+        burst = np.array(burst, dtype=np.int64)
+    
+    # Arrival order, ties broken by natural PID rank and then input order (lexsort is stable)
+    order = np.lexsort((np.frombuffer(name_rank, dtype=np.int64)[pid_index], arrival))
+    sorted_arrival = arrival[order]
+    sorted_burst = burst[order]
+    
+    work = np.cumsum(sorted_burst)
+    release = sorted_arrival - (work - sorted_burst)
+    finish = work + np.maximum(np.maximum.accumulate(release), 0)
+    
+    finish_by_job = np.empty(n, dtype=np.int64)
+    finish_by_job[order] = finish
+    if table is not None:
+        # Write the outputs through views of the table's columns instead of ProcessTable.store's row loops
+        turnaround = finish_by_job - arrival
+        np.frombuffer(table.remaining, dtype=np.int64)[:] = 0
+        np.frombuffer(table.finish, dtype=np.int64)[:] = finish_by_job
+        np.frombuffer(table.turnaround, dtype=np.int64)[:] = turnaround
+        np.frombuffer(table.waiting, dtype=np.int64)[:] = turnaround - burst
+    else:
+        store_schedule(processes, [0] * n, finish_by_job.tolist())
+    
+    total_time = int(finish[-1])
+    total_idle = total_time - int(work[-1])
+    if not include_gantt:
+        return GanttTrace(), total_time, total_idle
+    names, name_codes = GanttTrace.intern_all(names)
+    gantt = GanttTrace(names)
+    
+    # Interleave an IDLE segment before every job that starts after the previous finish
+    start = finish - sorted_burst
+    previous_end = np.concatenate(([0], finish[:-1]))
+    gap = start > previous_end
+    slots = np.arange(n) + np.cumsum(gap)
+    idle_slots = slots[gap] - 1
+    columns = np.zeros((3, n + int(gap.sum())), dtype=np.int64)
+    columns[0, slots] = np.array(name_codes, dtype=np.int64)[pid_index[order]]
+    columns[1, slots] = start
+    columns[2, slots] = finish
+    columns[1, idle_slots] = previous_end[gap]
+    columns[2, idle_slots] = start[gap]
+    for column, values in zip((gantt.pid_index, gantt.starts, gantt.ends), columns):
+        column.frombytes(values.tobytes())
+    return gantt, total_time, total_idle
+
+
+def dispatch_pid_order(processes: Workload) -> List[int]:
+    """
+    Rows in natural PID order, with rows of equal PID keys in FCFS dispatch order
+    
+    FCFS dispatches by arrival time, then PID rank, then input order, so
+    among equal ranks sorting by arrival (stably) gives the dispatch order.
+    """
+    n = len(processes)
+    if n == 0:
+        return []
+    if np is None:
+        names, pid_index, name_rank = workload_pids(processes)
+        arrival = workload_times(processes)[0]
+        return sorted(range(n), key=lambda i: (name_rank[pid_index[i]], arrival[i]))
+    if isinstance(processes, ProcessTable):
+        name_rank = processes.name_rank
+        pid_index = np.frombuffer(processes.pid_index, dtype=np.int64)
+        arrival = np.frombuffer(processes.arrival, dtype=np.int64)
+    else:
+        names, pid_index, name_rank = workload_pids(processes)
+        pid_index = np.array(pid_index, dtype=np.int64)
+        arrival = np.array(workload_times(processes)[0], dtype=np.int64)
+    return np.lexsort((arrival, np.frombuffer(name_rank, dtype=np.int64)[pid_index]))
 
 
 class FCFSAlgorithm(BaseAlgorithm):
     """First Come First Served - Non-preemptive"""
     
-    def execute(self, processes: List[Process], **kwargs) -> Dict:
+    def build_policy(self, **kwargs) -> Tuple[str, ReadyQueuePolicy]:
+        return "FCFS", FCFSPolicy()
+    
+    def calculate_results(self, algorithm_name: str, processes: Workload,
+                          gantt: List[dict], total_time: int, total_idle: int,
+                          n_cpus: int = 1, pid_order: Optional[List[int]] = None) -> dict:
+        """Results with processes sharing a PID key listed in dispatch order (see dispatch_pid_order)"""
+        return super().calculate_results(algorithm_name, processes, gantt, total_time, total_idle,
+                                         n_cpus, dispatch_pid_order(processes))
+    
+    def execute(self, processes: Workload, n_cpus: int = 1,
+                per_core_queues: bool = False, include_gantt: bool = True,
+                coalesce: bool = True, **kwargs) -> Dict:
         """
         Execute FCFS algorithm
         
+        A single CPU uses the vectorized closed form when NumPy is available.
+        
         Args:
-            processes: List of processes to schedule
-            
+            processes: Processes to schedule, as a list or a ProcessTable
+            n_cpus: Number of simulated CPU cores
+            per_core_queues: Give each core its own ready queue
+            include_gantt: Return the Gantt chart; otherwise it is left empty and
+                "total_time" and "dispatches" are returned instead
+            coalesce: Merge back-to-back segments of the same process
+        
         Returns:
             Dictionary with results
         """
-        # Sort by arrival time, then by PID
-        processes = sorted(processes, key=lambda x: (x.arrival_time, *pid_key(x.pid)))
-        gantt = []
-        current_time = 0
-        total_idle = 0
-        
-        for proc in processes:
-            # Handle idle time
-            if current_time < proc.arrival_time:
-                idle_duration = proc.arrival_time - current_time
-                gantt.append({"pid": "IDLE", "start": current_time, "end": proc.arrival_time})
-                total_idle += idle_duration
-                current_time = proc.arrival_time
-            
-            # Execute process
-            start_time = current_time
-            current_time += proc.burst_time
-            gantt.append({"pid": proc.pid, "start": start_time, "end": current_time})
-            
-            # Calculate metrics
-            proc.finish_time = current_time
-            proc.turnaround_time = proc.finish_time - proc.arrival_time
-            proc.waiting_time = proc.turnaround_time - proc.burst_time
-        
-        total_time = current_time
+        if np is not None and n_cpus == 1:
+            gantt, total_time, total_idle = fcfs_closed_form(processes, include_gantt)
+            results = self.calculate_results("FCFS", processes, gantt, total_time, total_idle)
+            if not include_gantt:
+                # One dispatch per process
+                results["total_time"] = total_time
+                results["dispatches"] = len(processes)
+            return results
         
-        return self.calculate_results("FCFS", processes, gantt, total_time, total_idle)
-
-
+        return self.simulate(*self.build_policy(), processes, n_cpus, per_core_queues, coalesce,
+                             include_gantt=include_gantt)
+    
+    def resimulate(self, previous: dict, processes: Workload, n_cpus: int = 1,
+                   per_core_queues: bool = False, coalesce: bool = True, **kwargs) -> Dict:
+        """Re-run on a changed workload; the single-CPU closed form beats resuming the kernel"""
+        if np is not None and n_cpus == 1:
+            return self.execute(processes, n_cpus, per_core_queues, coalesce=coalesce, **kwargs)
+        return super().resimulate(previous, processes, n_cpus, per_core_queues, coalesce, **kwargs)
@@ -0,0 +1,519 @@
+"""Discrete-Event Simulation Kernel"""
+import copy
+import heapq
+from array import array
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from typing import Iterator, List, Optional, Tuple
+from models.gantt_trace import IDLE, PLAIN_FIELDS, GanttTrace
+from models.process_table import Workload, store_schedule, workload_pids, workload_times
+
+
+class ReadyQueuePolicy(ABC):
+    """
+    Ready-queue discipline plugged into the simulation kernel
+    
+    Policies only see integer job indices; per-job data lives in the
+    kernel's columns (arrival, burst, priority, remaining, rank); the PID of
+    job j is names[pid_index[j]].
+    Preemptive policies are consulted through preempts() whenever new
+    jobs arrive while another job is running.
+    """
+    
+    preemptive = False
+    # Whether a run may start from a checkpoint of an earlier run (see checkpoint.py)
+    resumable = True
+    # Kernel columns whose min/max over the whole workload the policy depends on;
+    # a checkpoint is only valid while they stay the same
+    workload_ranges: Tuple[str, ...] = ()
+    
+    def bind(self, kernel: 'SimulationKernel') -> None:
+        """Attach the policy to a kernel at the start of a run"""
+        self.kernel = kernel
+    
+    @abstractmethod
+    def push(self, job: int, now: int) -> None:
+        """Admit an arrived job"""
+        pass
+    
+    @abstractmethod
+    def pop(self, now: int) -> int:
+        """Remove and return the next job to dispatch"""
+        pass
+    
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+    
+    def push_many(self, jobs: List[int], now: int) -> None:
+        """Admit a batch of jobs that arrived at or before now, in arrival order"""
+        for job in jobs:
+            self.push(job, now)
+    
+    def requeue(self, job: int, now: int) -> None:
+        """Return a preempted job to the ready queue"""
+        self.push(job, now)
+    
+    def complete(self, job: int, now: int) -> None:
+        """Called when a dispatched job finishes"""
+        pass
+    
+    def preempts(self, job: int, now: int) -> bool:
+        """Whether the ready queue should take the CPU from the running job"""
+        return False
+    
+    def expires(self, job: int, now: int) -> bool:
+        """
+        Whether a job whose time slice ran out before it finished leaves the CPU
+        
+        Quantum-based policies always take it off; policies whose slices only
+        mark the next possible preemption re-check here, and the job keeps
+        running with a new time_slice() if it is not preempted after all.
+        """
+        return True
+    
+    def time_slice(self, job: int, now: int) -> int:
+        """
+        How long a dispatched job runs before the next scheduling event
+        
+        Preemptive policies are asked again after arrivals that did not
+        preempt the job.
+        """
+        return self.kernel.remaining[job]
+    
+    def skip_ahead(self, now: int, next_arrival: Optional[int]) -> Optional[Tuple[dict, int]]:
+        """
+        Optionally advance several dispatches at once
+        
+        Returns:
+            Tuple of (Gantt record covering the skipped interval, job it
+            belongs to or -1 if it spans several), or None
+        """
+        return None
+
+
+class HeapPolicy(ReadyQueuePolicy):
+    """Ready queue ordered by a per-job key, smallest first"""
+    
+    def bind(self, kernel: 'SimulationKernel') -> None:
+        super().bind(kernel)
+        self.heap = []
+    
+    @abstractmethod
+    def key(self, job: int) -> tuple:
+        """Selection key for a job; the job index breaks any remaining tie"""
+        pass
+    
+    def push(self, job: int, now: int) -> None:
+        heapq.heappush(self.heap, (*self.key(job), job))
+    
+    def push_many(self, jobs: List[int], now: int) -> None:
+        if len(jobs) > len(self.heap):
+            self.heap.extend((*self.key(job), job) for job in jobs)
+            heapq.heapify(self.heap)
+        else:
+            for job in jobs:
+                self.push(job, now)
+    
+    def pop(self, now: int) -> int:
+        return heapq.heappop(self.heap)[-1]
+    
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class SimulationKernel:
+    """
+    Event-driven scheduler loop for one or more CPUs
+    
+    Jobs enter from an arrival stream sorted by (arrival_time, pid_key),
+    wait in the policy's ready queue, and leave a CPU through a
+    completion/preemption event heap. Free CPUs wait in a core-availability
+    heap, so a run costs O(events * log cores) and idle periods are skipped
+    in O(1). Events of a job preempted on arrival are invalidated lazily:
+    they stay in the heap and are dropped when they surface.
+    
+    With per_core_queues every CPU gets its own copy of the policy and each
+    arrival joins the least-loaded CPU; otherwise all CPUs share one queue.
+    With coalesce a job dispatched again right after its own slice extends
+    its Gantt segment instead of opening a new one; jobs sharing a PID are
+    kept apart. Without include_gantt, run() only counts the dispatches
+    (left in self.dispatches) and returns an empty chart.
+    """
+    
+    def __init__(self, policy: ReadyQueuePolicy, n_cpus: int = 1, per_core_queues: bool = False,
+                 coalesce: bool = True, include_gantt: bool = True):
+        if n_cpus <= 0:
+            raise ValueError(f"Number of CPUs must be greater than 0, got {n_cpus}")
+        self.policy = policy
+        self.n_cpus = n_cpus
+        self.per_core_queues = per_core_queues
+        self.coalesce = coalesce
+        self.include_gantt = include_gantt
+    
+    def run(self, processes: Workload, checkpoint: Optional['Checkpoint'] = None) -> Tuple[GanttTrace, int, int]:
+        """
+        Simulate the processes and write finish/turnaround/waiting times back
+        
+        Per-core Gantt lanes and busy times are left in self.lanes and
+        self.core_busy. With several CPUs the returned chart merges all lanes
+        (each segment tagged with its "core") and the idle time is summed
+        over CPUs.
+        
+        Args:
+            processes: Processes to schedule, as a list or a ProcessTable
+            checkpoint: Start from this point of an earlier run instead of time 0
+        
+        Returns:
+            Tuple of (gantt chart, total time, total idle time)
+        """
+        for _ in self._simulate(processes, None, checkpoint):
+            pass
+        lanes = self.lanes
+        if not self.include_gantt:
+            self.dispatches = sum(lane.dispatches for lane in lanes)
+            return GanttTrace(), self.total_time, self.total_idle
+        if self.n_cpus == 1:
+            return lanes[0], self.total_time, self.total_idle
+        
+        merged = sorted(
+            (lane.starts[position], core, position)
+            for core, lane in enumerate(lanes) for position in range(len(lane))
+        )
+        gantt = GanttTrace(lanes[0].names)
+        gantt.cores = array('q')
+        for _, core, position in merged:
+            lane = lanes[core]
+            gantt.add(lane.pid_index[position], lane.starts[position], lane.ends[position])
+            gantt.cores.append(core)
+            if position in lane.merges:
+                gantt.merges[len(gantt) - 1] = lane.merges[position]
+        return gantt, self.total_time, self.total_idle
+    
+    def stream(self, processes: Workload) -> Iterator[Tuple[str, dict]]:
+        """
+        Simulate the processes, yielding records as they are decided
+        
+        Yields ("segment", segment dict) and ("completion", {"pid",
+        "finish_time", "turnaround_time", "waiting_time"}) pairs without
+        keeping the Gantt chart. Segments carry "core" with several CPUs;
+        with coalesce a segment is held back until the next dispatch on its
+        core shows it cannot grow. Totals are left in self.total_time and
+        self.total_idle when the stream ends.
+        
+        Args:
+            processes: Processes to schedule, as a list or a ProcessTable
+        """
+        out = []
+        for _ in self._simulate(processes, out):
+            yield from out
+            out.clear()
+        yield from out
+    
+    def _simulate(self, processes: Workload, out: Optional[list],
+                  checkpoint: Optional['Checkpoint'] = None) -> Iterator[None]:
+        """
+        Event loop shared by run() and stream()
+        
+        With out set, lanes forward segments and completions into it and the
+        loop yields whenever it holds records; otherwise segments collect in
+        GanttTrace lanes and the generator only runs to completion.
+        """
+        n = len(processes)
+        self.names, self.pid_index, name_rank = workload_pids(processes)
+        self.arrival, self.burst, self.priority = workload_times(processes)
+        self.remaining = list(self.burst)
+        
+        # Natural PID order as a dense rank; input index breaks duplicate PIDs
+        row_rank = [name_rank[code] for code in self.pid_index]
+        self.pid_order = by_pid = sorted(range(n), key=row_rank.__getitem__)
+        self.rank = [0] * n
+        for position, job in enumerate(by_pid):
+            self.rank[job] = position
+        
+        arrival, rank, remaining, pid_index = self.arrival, self.rank, self.remaining, self.pid_index
+        stream = sorted(range(n), key=lambda i: (arrival[i], rank[i]))
+        stream_arrival = [arrival[i] for i in stream]
+        
+        n_cpus = self.n_cpus
+        per_core = self.per_core_queues
+        policy = self.policy
+        if per_core:
+            queues = [copy.copy(policy) for _ in range(n_cpus)]
+            for queue in queues:
+                queue.bind(self)
+        else:
+            policy.bind(self)
+            queues = [policy] * n_cpus
+        preemptive = policy.preemptive
+        fast_forward = n_cpus == 1
+        
+        finish = [0] * n
+        # Gantt codes per job; the names table gains "IDLE" at code 0
+        names, name_codes = GanttTrace.intern_all(self.names)
+        codes = [name_codes[code] for code in pid_index]
+        if out is None and not self.include_gantt:
+            lanes = [_TallyLane() for _ in range(n_cpus)]
+        elif out is None:
+            lanes = [GanttTrace(names, self.coalesce) for _ in range(n_cpus)]
+        else:
+            lanes = [_StreamLane(names, self.coalesce, out, core if n_cpus > 1 else None)
+                     for core in range(n_cpus)]
+        self.lanes = lanes
+        self.core_busy = busy = [0] * n_cpus
+        events = []
+        current_time = 0
+        cursor = 0
+        done = 0
+        seq = 0
+        
+        # Per-core running job, dispatch token, event time, segment start and last accounting time
+        running = [-1] * n_cpus
+        token = [-1] * n_cpus
+        ends = [0] * n_cpus
+        started = [0] * n_cpus
+        accounted = [0] * n_cpus
+        free_since = [0] * n_cpus
+        free = list(range(n_cpus))
+        n_free = n_cpus
+        
+        # Queued plus running jobs per core, with a lazily updated min-heap for placement
+        loads = [0] * n_cpus
+        load_heap = [(0, core) for core in range(n_cpus)]
+        
+        if checkpoint is not None:
+            # Jobs arriving before the checkpoint are done: take their finish times and lanes as given
+            cursor = done = bisect_left(stream_arrival, checkpoint.time)
+            for job in stream[:cursor]:
+                finish[job] = checkpoint.finish[job]
+                remaining[job] = 0
+            current_time = max(finish)
+            for core, prefix in enumerate(checkpoint.lanes):
+                lanes[core].extend(prefix)
+                busy[core] = sum(end - start for code, start, end in zip(prefix.pid_index, prefix.starts, prefix.ends)
+                                 if code)
+                free_since[core] = prefix.ends[-1] if len(prefix) else 0
+        
+        def dispatch(core: int) -> None:
+            nonlocal seq, n_free
+            queue = queues[core]
+            job = queue.pop(current_time)
+            if current_time > free_since[core]:
+                lanes[core].add(0, free_since[core], current_time)
+            running[core] = job
+            token[core] = seq
+            seq += 1
+            started[core] = accounted[core] = current_time
+            ends[core] = current_time + queue.time_slice(job, current_time)
+            heapq.heappush(events, (ends[core], token[core], core))
+            n_free -= 1
+        
+        def admit() -> None:
+            nonlocal cursor
+            end = bisect_right(stream_arrival, current_time, cursor)
+            if end == cursor:
+                return
+            batch = stream[cursor:end]
+            cursor = end
+            if not per_core:
+                policy.push_many(batch, current_time)
+                return
+            touched = []
+            for job in batch:
+                while loads[load_heap[0][1]] != load_heap[0][0]:
+                    heapq.heappop(load_heap)
+                core = load_heap[0][1]
+                queues[core].push(job, current_time)
+                loads[core] += 1
+                heapq.heappush(load_heap, (loads[core], core))
+                touched.append(core)
+            for core in touched:
+                if running[core] < 0:
+                    dispatch(core)
+        
+        def fill() -> None:
+            nonlocal current_time
+            while free and len(policy):
+                if fast_forward:
+                    skipped = policy.skip_ahead(current_time, stream_arrival[cursor] if cursor < n else None)
+                    if skipped is not None:
+                        record, job = skipped
+                        if current_time > free_since[0]:
+                            lanes[0].add(0, free_since[0], current_time)
+                        lanes[0].append(record, job)
+                        busy[0] += record["end"] - current_time
+                        current_time = free_since[0] = record["end"]
+                        continue
+                dispatch(heapq.heappop(free))
+        
+        while done < n:
+            if out:
+                yield
+            
+            # Drop events invalidated by an earlier preemption
+            while events and events[0][1] != token[events[0][2]]:
+                heapq.heappop(events)
+            
+            if events and events[0][0] == current_time:
+                # Completion or quantum expiry of a running job; all events due now go before dispatching
+                _, _, core = heapq.heappop(events)
+                job = running[core]
+                remaining[job] -= current_time - accounted[core]
+                accounted[core] = current_time
+                queue = queues[core]
+                if remaining[job]:
+                    # Arrivals up to now are queued BEFORE the preempted job
+                    admit()
+                    if not queue.expires(job, current_time):
+                        ends[core] = current_time + queue.time_slice(job, current_time)
+                        token[core] = seq
+                        seq += 1
+                        heapq.heappush(events, (ends[core], token[core], core))
+                        continue
+                lanes[core].add(codes[job], started[core], current_time, job)
+                busy[core] += current_time - started[core]
+                free_since[core] = current_time
+                
+                if remaining[job] == 0:
+                    finish[job] = current_time
+                    done += 1
+                    if out is not None:
+                        # The job's last segments may still be held back, possibly on other cores
+                        for lane in lanes:
+                            if lane.pending is not None and lane.pending[4] == job:
+                                lane.flush()
+                        turnaround = current_time - arrival[job]
+                        out.append(("completion", {
+                            "pid": self.names[pid_index[job]],
+                            "finish_time": current_time,
+                            "turnaround_time": turnaround,
+                            "waiting_time": turnaround - self.burst[job]
+                        }))
+                    queue.complete(job, current_time)
+                    if per_core:
+                        loads[core] -= 1
+                        heapq.heappush(load_heap, (loads[core], core))
+                else:
+                    queue.requeue(job, current_time)
+                running[core] = -1
+                n_free += 1
+                
+                if per_core:
+                    if len(queue):
+                        dispatch(core)
+                else:
+                    heapq.heappush(free, core)
+                continue
+            
+            admit()
+            if not per_core:
+                fill()
+            
+            if not events:
+                # Every CPU idle - jump to next arrival
+                current_time = stream_arrival[cursor]
+                continue
+            
+            end_time = events[0][0]
+            if cursor < n and stream_arrival[cursor] < end_time and (preemptive or per_core or n_free):
+                # Arrivals while running: place them, fill free CPUs and let the policy decide
+                current_time = stream_arrival[cursor]
+                admit()
+                if not per_core:
+                    fill()
+                if not preemptive:
+                    continue
+                for core in range(n_cpus):
+                    job = running[core]
+                    if job < 0:
+                        continue
+                    remaining[job] -= current_time - accounted[core]
+                    accounted[core] = current_time
+                    queue = queues[core]
+                    if len(queue) and queue.preempts(job, current_time):
+                        lanes[core].add(codes[job], started[core], current_time, job)
+                        busy[core] += current_time - started[core]
+                        free_since[core] = current_time
+                        queue.requeue(job, current_time)
+                        running[core] = -1
+                        n_free += 1
+                        dispatch(core)
+                    else:
+                        # The arrivals may move the running job's next scheduling event
+                        new_end = current_time + queue.time_slice(job, current_time)
+                        if new_end != ends[core]:
+                            ends[core] = new_end
+                            token[core] = seq
+                            seq += 1
+                            heapq.heappush(events, (new_end, token[core], core))
+                continue
+            
+            current_time = end_time
+        
+        store_schedule(processes, remaining, finish)
+        self.total_time = current_time
+        self.total_idle = n_cpus * current_time - sum(busy)
+        if out is not None:
+            for lane in lanes:
+                lane.flush()
+
+
+class _StreamLane:
+    """Gantt lane for SimulationKernel.stream(): forwards segments instead of storing them"""
+    
+    def __init__(self, names: List[str], coalesce: bool, out: list, core: Optional[int]):
+        self.names = names
+        self.coalesce = coalesce
+        self.out = out
+        self.core = core
+        self.codes = {name: code for code, name in enumerate(names)}
+        # Held-back segment as [code, start, end, dispatches, job]
+        self.pending = None
+    
+    def add(self, code: int, start: int, end: int, job: int = -1, dispatches: int = 1) -> None:
+        pending = self.pending
+        if pending is not None and self.coalesce and job >= 0 and pending[4] == job and pending[2] == start:
+            pending[2] = end
+            pending[3] += dispatches
+            return
+        self.flush()
+        self.pending = [code, start, end, dispatches, job]
+    
+    def append(self, record: dict, job: int = -1) -> None:
+        if record.keys() <= PLAIN_FIELDS:
+            self.add(self.codes[record["pid"]], record["start"], record["end"], job, record.get("dispatches", 1))
+            return
+        self.flush()
+        self.out.append(("segment", record))
+    
+    def flush(self) -> None:
+        if self.pending is None:
+            return
+        code, start, end, dispatches, _ = self.pending
+        self.pending = None
+        segment = {"pid": self.names[code], "start": start, "end": end}
+        if self.core is not None:
+            segment["core"] = self.core
+        if dispatches > 1:
+            segment["dispatches"] = dispatches
+        self.out.append(("segment", segment))
+
+
+class _TallyLane:
+    """Gantt lane for runs without a chart: counts dispatches like GanttTrace.dispatches"""
+    
+    def __init__(self):
+        self.dispatches = 0
+    
+    def add(self, code: int, start: int, end: int, job: int = -1) -> None:
+        if code:
+            self.dispatches += 1
+    
+    def append(self, record: dict, job: int = -1) -> None:
+        if "cycle" in record:
+            self.dispatches += len(record["cycle"]) * record["rounds"]
+        elif record["pid"] != IDLE:
+            self.dispatches += record.get("dispatches", 1)
+    
+    def extend(self, segments: GanttTrace) -> None:
+        self.dispatches += segments.dispatches
@@ -0,0 +1,138 @@
+"""Multi-Level Feedback Queue Algorithm"""
+from collections import deque
+from typing import List, Dict, Optional, Sequence, Tuple
+from models.process_table import Workload
+from .base_algorithm import BaseAlgorithm
+from .kernel import ReadyQueuePolicy, SimulationKernel
+
+
+class MLFQPolicy(ReadyQueuePolicy):
+    """
+    Per-level FIFO deques with demotion on quantum expiry and periodic boost
+    
+    Demotion happens at the kernel's quantum-expiry event. A boost is due
+    every boost_interval time units and is applied at the first scheduling
+    decision after it, so nothing is scanned per time unit.
+    """
+    
+    preemptive = True
+    
+    def __init__(self, quanta: Sequence[int], boost_interval: Optional[int] = None):
+        self.quanta = list(quanta)
+        self.boost_interval = boost_interval
+    
+    def bind(self, kernel: SimulationKernel) -> None:
+        super().bind(kernel)
+        self.queues = [deque() for _ in self.quanta]
+        self.size = 0
+        self.epoch = 0
+        # Level and quantum deadline of each running job; boosted ones keep their level
+        self.running_levels = {}
+        self.deadlines = {}
+        self.keep_level = set()
+    
+    def _boost(self, now: int) -> None:
+        """Move every job to the top level if a boost is due"""
+        if self.boost_interval is None:
+            return
+        epoch = now // self.boost_interval
+        if epoch == self.epoch:
+            return
+        self.epoch = epoch
+        top = self.queues[0]
+        for queue in self.queues[1:]:
+            top.extend(queue)
+            queue.clear()
+        for job, level in self.running_levels.items():
+            if level:
+                # A running job finishes its slice and then stays at the top level
+                self.running_levels[job] = 0
+                self.keep_level.add(job)
+    
+    def _best_level(self) -> int:
+        for level, queue in enumerate(self.queues):
+            if queue:
+                return level
+        return len(self.queues)
+    
+    def push(self, job: int, now: int) -> None:
+        self._boost(now)
+        self.queues[0].append(job)
+        self.size += 1
+    
+    def push_many(self, jobs: List[int], now: int) -> None:
+        self._boost(now)
+        self.queues[0].extend(jobs)
+        self.size += len(jobs)
+    
+    def pop(self, now: int) -> int:
+        self._boost(now)
+        level = self._best_level()
+        job = self.queues[level].popleft()
+        self.size -= 1
+        self.running_levels[job] = level
+        self.deadlines[job] = now + self.quanta[level]
+        return job
+    
+    def requeue(self, job: int, now: int) -> None:
+        self._boost(now)
+        level = self.running_levels.pop(job)
+        if now >= self.deadlines.pop(job) and job not in self.keep_level:
+            # Used its whole quantum: demote one level
+            level = min(level + 1, len(self.queues) - 1)
+        self.keep_level.discard(job)
+        self.queues[level].append(job)
+        self.size += 1
+    
+    def complete(self, job: int, now: int) -> None:
+        del self.running_levels[job]
+        del self.deadlines[job]
+        self.keep_level.discard(job)
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def preempts(self, job: int, now: int) -> bool:
+        self._boost(now)
+        return self._best_level() < self.running_levels[job]
+    
+    def time_slice(self, job: int, now: int) -> int:
+        return min(self.kernel.remaining[job], self.deadlines[job] - now)
+
+
+class MLFQAlgorithm(BaseAlgorithm):
+    """Multi-Level Feedback Queue - Preemptive"""
+    
+    def build_policy(self, quanta: Sequence[int] = (4, 8, 16), boost_interval: Optional[int] = 100,
+                     **kwargs) -> Tuple[str, ReadyQueuePolicy]:
+        if not quanta or any(q <= 0 for q in quanta):
+            raise ValueError(f"MLFQ quanta must be positive, got {list(quanta)}")
+        if boost_interval is not None and boost_interval <= 0:
+            raise ValueError(f"Boost interval must be greater than 0, got {boost_interval}")
+        name = f"MLFQ (Q={'/'.join(str(q) for q in quanta)})"
+        return name, MLFQPolicy(quanta, boost_interval)
+    
+    def execute(self, processes: Workload, quanta: Sequence[int] = (4, 8, 16),
+                boost_interval: Optional[int] = 100, n_cpus: int = 1,
+                per_core_queues: bool = False, coalesce: bool = True, **kwargs) -> Dict:
+        """
+        Execute MLFQ algorithm
+        
+        New processes enter the top level. A process that uses its whole
+        quantum drops one level; one preempted by a higher-level arrival
+        stays at its level. Every boost_interval time units all processes
+        return to the top level.
+        
+        Args:
+            processes: Processes to schedule, as a list or a ProcessTable
+            quanta: Time quantum per level, top level first
+            boost_interval: Time between priority boosts (None disables boosting)
+            n_cpus: Number of simulated CPU cores
+            per_core_queues: Give each core its own ready queue
+            coalesce: Merge back-to-back segments of the same process
+        
+        Returns:
+            Dictionary with results
+        """
+        return self.simulate(*self.build_policy(quanta, boost_interval), processes,
+                             n_cpus, per_core_queues, coalesce)
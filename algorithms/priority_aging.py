@@ -0,0 +1,142 @@
+"""Preemptive Priority Scheduling with Aging"""
+from collections import deque
+from typing import List, Dict, Tuple
+from models.process_table import Workload
+from .base_algorithm import BaseAlgorithm
+from .kernel import ReadyQueuePolicy, SimulationKernel
+
+
+class AgingPriorityPolicy(ReadyQueuePolicy):
+    """
+    Bucketed priority index with global aging ticks
+    
+    The ready set is a ring of deques indexed by effective priority. Every
+    aging_interval time units (on a global clock) each waiting job gains one
+    level, which is a rotation of the ring plus merging the two best levels;
+    the smaller deque is moved so aging costs O(1) amortised.
+    """
+    
+    preemptive = True
+    # Levels span the workload's priority range and aging stops at its minimum
+    workload_ranges = ("priority",)
+    
+    def __init__(self, aging_interval: int):
+        self.aging_interval = aging_interval
+    
+    def bind(self, kernel: SimulationKernel) -> None:
+        super().bind(kernel)
+        self.floor = min(kernel.priority, default=0)
+        self.levels = [deque() for _ in range(max(kernel.priority, default=0) - self.floor + 1)]
+        self.base = 0          # physical slot of the best level
+        self.best = 0          # lowest level that may be non-empty
+        self.size = 0
+        self.tick = 0
+        self.running_levels = {}
+    
+    def _age(self, now: int) -> None:
+        """Apply the aging ticks elapsed since the last call"""
+        tick = now // self.aging_interval
+        steps = min(tick - self.tick, len(self.levels) - 1)
+        self.tick = tick
+        if not self.size:
+            return
+        levels = self.levels
+        for _ in range(steps):
+            top = levels[self.base]
+            self.base = (self.base + 1) % len(levels)
+            promoted = levels[self.base]
+            # Jobs already at the best level stay ahead of the promoted ones
+            if len(top) <= len(promoted):
+                promoted.extendleft(reversed(top))
+                top.clear()
+            else:
+                top.extend(promoted)
+                promoted.clear()
+                levels[self.base - 1], levels[self.base] = promoted, top
+            self.best = max(self.best - 1, 0)
+    
+    def _best_level(self) -> int:
+        """Lowest non-empty level; callers check size first"""
+        levels, base, count = self.levels, self.base, len(self.levels)
+        while not levels[(base + self.best) % count]:
+            self.best += 1
+        return self.best
+    
+    def push(self, job: int, now: int) -> None:
+        self._age(now)
+        level = self.kernel.priority[job] - self.floor
+        self.levels[(self.base + level) % len(self.levels)].append(job)
+        self.best = min(self.best, level)
+        self.size += 1
+    
+    def push_many(self, jobs: List[int], now: int) -> None:
+        for job in jobs:
+            self.push(job, now)
+    
+    def pop(self, now: int) -> int:
+        self._age(now)
+        level = self._best_level()
+        self.size -= 1
+        job = self.levels[(self.base + level) % len(self.levels)].popleft()
+        self.running_levels[job] = level
+        return job
+    
+    def requeue(self, job: int, now: int) -> None:
+        del self.running_levels[job]
+        self.push(job, now)
+    
+    def complete(self, job: int, now: int) -> None:
+        del self.running_levels[job]
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def preempts(self, job: int, now: int) -> bool:
+        self._age(now)
+        return self.size > 0 and self._best_level() < self.running_levels[job]
+    
+    def expires(self, job: int, now: int) -> bool:
+        # With several CPUs, the waiting job the slice was timed for may have been taken by another core
+        return self.preempts(job, now)
+    
+    def time_slice(self, job: int, now: int) -> int:
+        # Run until completion or the tick at which aging lifts a waiting job above this one
+        remaining = self.kernel.remaining[job]
+        running_level = self.running_levels[job]
+        self._age(now)
+        if not self.size or running_level == 0:
+            return remaining
+        ticks = self._best_level() - running_level + 1
+        return min(remaining, (self.tick + ticks) * self.aging_interval - now)
+
+
+class PriorityAgingAlgorithm(BaseAlgorithm):
+    """Priority Scheduling - Preemptive with aging"""
+    
+    def build_policy(self, aging_interval: int = 5, **kwargs) -> Tuple[str, ReadyQueuePolicy]:
+        if aging_interval <= 0:
+            raise ValueError(f"Aging interval must be greater than 0, got {aging_interval}")
+        return f"Priority with Aging (AI={aging_interval})", AgingPriorityPolicy(aging_interval)
+    
+    def execute(self, processes: Workload, aging_interval: int = 5, n_cpus: int = 1,
+                per_core_queues: bool = False, coalesce: bool = True, **kwargs) -> Dict:
+        """
+        Execute Preemptive Priority Scheduling with aging
+        
+        A running process keeps the effective priority it was dispatched
+        with and is preempted when a waiting process becomes strictly more
+        urgent, either on arrival or through aging. Preempted processes
+        return at their base priority. Ties are FIFO within a level.
+        
+        Args:
+            processes: Processes to schedule, as a list or a ProcessTable
+            aging_interval: Time units per one-level priority boost while waiting
+            n_cpus: Number of simulated CPU cores
+            per_core_queues: Give each core its own ready queue
+            coalesce: Merge back-to-back segments of the same process
+        
+        Returns:
+            Dictionary with results
+        """
+        return self.simulate(*self.build_policy(aging_interval), processes,
+                             n_cpus, per_core_queues, coalesce)
@@ -1,82 +1,142 @@
 """Round Robin Algorithm"""
-from typing import List, Dict
-from models.process import Process
-from utils.pid_utils import pid_key
+from collections import deque
+from typing import List, Dict, Optional, Sequence, Tuple
+from models.gantt_trace import GanttTrace
+from models.process_table import Workload
 from .base_algorithm import BaseAlgorithm
+from .kernel import ReadyQueuePolicy, SimulationKernel
+
+
+def expand_gantt(gantt: Sequence[dict]) -> GanttTrace:
+    """
+    Expand fast-forwarded cycle records into per-quantum Gantt segments
+    
+    Args:
+        gantt: Gantt chart data, possibly containing "CYCLE" records
+    
+    Returns:
+        Gantt chart data with one segment per dispatched quantum
+    """
+    expanded = GanttTrace()
+    for segment in gantt:
+        if segment['pid'] != 'CYCLE':
+            expanded.append(segment)
+            continue
+        start = segment['start']
+        quantum = segment['quantum']
+        codes = [expanded.intern(pid) for pid in segment['cycle']]
+        for _ in range(segment['rounds']):
+            for code in codes:
+                expanded.add(code, start, start + quantum)
+                start += quantum
+    return expanded
+
+
+class RoundRobinPolicy(ReadyQueuePolicy):
+    """FIFO ready queue with a fixed time quantum"""
+    
+    def __init__(self, time_quantum: int, fast_forward: bool = False):
+        self.time_quantum = time_quantum
+        self.fast_forward = fast_forward
+        # Where skipped rounds start depends on the whole run so far
+        self.resumable = not fast_forward
+    
+    def bind(self, kernel: SimulationKernel) -> None:
+        super().bind(kernel)
+        self.queue = deque()
+        # Dispatches since the last fast-forward attempt (keeps checks O(1) amortised)
+        self.since_attempt = 0
+    
+    def push(self, job: int, now: int) -> None:
+        self.queue.append(job)
+    
+    def push_many(self, jobs: List[int], now: int) -> None:
+        self.queue.extend(jobs)
+    
+    def pop(self, now: int) -> int:
+        self.since_attempt += 1
+        return self.queue.popleft()
+    
+    def __len__(self) -> int:
+        return len(self.queue)
+    
+    def time_slice(self, job: int, now: int) -> int:
+        return min(self.time_quantum, self.kernel.remaining[job])
+    
+    def skip_ahead(self, now: int, next_arrival: Optional[int]) -> Optional[Tuple[dict, int]]:
+        """Apply whole rounds in which no job finishes and nothing arrives"""
+        queue = self.queue
+        if not self.fast_forward or self.since_attempt < len(queue):
+            return None
+        self.since_attempt = 0
+        
+        remaining = self.kernel.remaining
+        quantum = self.time_quantum
+        rounds = (min(remaining[job] for job in queue) - 1) // quantum
+        if next_arrival is not None:
+            rounds = min(rounds, (next_arrival - now - 1) // (len(queue) * quantum))
+        if rounds <= 0:
+            return None
+        
+        slice_time = rounds * quantum
+        for job in queue:
+            remaining[job] -= slice_time
+        end_time = now + slice_time * len(queue)
+        
+        # Queue order is unchanged after whole rounds; without coalescing a lone
+        # job is a one-process cycle too, so expand_gantt restores its quanta
+        names, pid_index = self.kernel.names, self.kernel.pid_index
+        if len(queue) == 1 and self.kernel.coalesce:
+            record = {"pid": names[pid_index[queue[0]]], "start": now, "end": end_time,
+                      "dispatches": rounds}
+            return record, queue[0]
+        return {
+            "pid": "CYCLE",
+            "start": now,
+            "end": end_time,
+            "cycle": [names[pid_index[job]] for job in queue],
+            "quantum": quantum,
+            "rounds": rounds
+        }, -1
 
 
 class RoundRobinAlgorithm(BaseAlgorithm):
     """Round Robin - Preemptive with corrected queue management"""
     
-    def execute(self, processes: List[Process], time_quantum: int = 3, **kwargs) -> Dict:
+    def build_policy(self, time_quantum: int = 3, fast_forward: bool = False,
+                     **kwargs) -> Tuple[str, ReadyQueuePolicy]:
+        if time_quantum <= 0:
+            raise ValueError(f"Time quantum must be greater than 0, got {time_quantum}")
+        return f"Round Robin (TQ={time_quantum})", RoundRobinPolicy(time_quantum, fast_forward)
+    
+    def execute(self, processes: Workload, time_quantum: int = 3,
+                fast_forward: bool = False, n_cpus: int = 1,
+                per_core_queues: bool = False, coalesce: bool = True,
+                include_gantt: bool = True, **kwargs) -> Dict:
         """
         Execute Round Robin algorithm
         
+        Newly arrived processes are queued before the preempted process.
+        
+        With fast_forward enabled, whole rounds in which no process finishes
+        and nothing arrives are computed arithmetically. A single queued
+        process yields one coalesced segment; k > 1 processes, or a single
+        one with coalesce off, yield one "CYCLE" record (see expand_gantt).
+        Finish, turnaround and waiting times are identical to the
+        step-by-step engine. Fast-forward only applies to a single CPU.
+        
         Args:
-            processes: List of processes to schedule
+            processes: Processes to schedule, as a list or a ProcessTable
             time_quantum: Time quantum for Round Robin
-            
+            fast_forward: Skip whole rounds instead of simulating each quantum
+            n_cpus: Number of simulated CPU cores
+            per_core_queues: Give each core its own ready queue
+            coalesce: Merge back-to-back segments of the same process
+            include_gantt: Return the Gantt chart; otherwise it is left empty and
+                "total_time" and "dispatches" are returned instead
+        
         Returns:
             Dictionary with results
         """
-        if time_quantum <= 0:
-            raise ValueError(f"Time quantum must be greater than 0, got {time_quantum}")
-        
-        gantt = []
-        current_time = 0
-        ready_queue = []
-        completed = []
-        total_idle = 0
-        
-        # Track which processes have been added to ready queue
-        remaining = sorted(processes, key=lambda x: (x.arrival_time, *pid_key(x.pid)))
-        
-        while len(completed) < len(processes):
-            # Add newly arrived processes to ready queue (BEFORE processing)
-            newly_arrived = [p for p in remaining if p.arrival_time <= current_time]
-            for proc in newly_arrived:
-                ready_queue.append(proc)
-                remaining.remove(proc)
-            
-            if not ready_queue:
-                # CPU idle - jump to next arrival
-                if remaining:
-                    next_arrival = min([p.arrival_time for p in remaining])
-                    idle_duration = next_arrival - current_time
-                    gantt.append({"pid": "IDLE", "start": current_time, "end": next_arrival})
-                    total_idle += idle_duration
-                    current_time = next_arrival
-                continue
-            
-            # Get next process from ready queue (FIFO order)
-            proc = ready_queue.pop(0)
-            
-            # Execute for time quantum or remaining time
-            execution_time = min(time_quantum, proc.remaining_time)
-            start_time = current_time
-            current_time += execution_time
-            gantt.append({"pid": proc.pid, "start": start_time, "end": current_time})
-            
-            proc.remaining_time -= execution_time
-            
-            # Add processes that arrived DURING execution BEFORE re-queueing current process
-            during_execution = [p for p in remaining if p.arrival_time <= current_time]
-            for p in during_execution:
-                ready_queue.append(p)
-                remaining.remove(p)
-            
-            # Check if process is complete
-            if proc.remaining_time == 0:
-                proc.finish_time = current_time
-                proc.turnaround_time = proc.finish_time - proc.arrival_time
-                proc.waiting_time = proc.turnaround_time - proc.burst_time
-                completed.append(proc)
-            else:
-                # Put back in ready queue (AFTER newly arrived processes)
-                ready_queue.append(proc)
-        
-        total_time = current_time
-        
-        return self.calculate_results(f"Round Robin (TQ={time_quantum})", processes, gantt, total_time, total_idle)
-
-
+        return self.simulate(*self.build_policy(time_quantum, fast_forward), processes,
+                             n_cpus, per_core_queues, coalesce, include_gantt=include_gantt)
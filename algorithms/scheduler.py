@@ -1,50 +1,281 @@
 """Main Scheduling Simulator"""
-from typing import List, Dict
-from models.process import Process
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import shared_memory, util
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+from models.process_table import ProcessTable, Workload
+from utils import workload_binary
 from .fcfs import FCFSAlgorithm
 from .sjf import SJFAlgorithm
 from .round_robin import RoundRobinAlgorithm
 from .priority import PriorityAlgorithm
+from .srtf import SRTFAlgorithm
+from .priority_aging import PriorityAgingAlgorithm
+from .mlfq import MLFQAlgorithm
 
 
 class SchedulingSimulator:
     """Main simulator class for all scheduling algorithms"""
     
-    def __init__(self, processes: List[Process]):
+    # Simulator method -> attribute holding its algorithm, for resume()
+    ALGORITHMS = {
+        "fcfs": "fcfs_algo",
+        "sjf": "sjf_algo",
+        "round_robin": "round_robin_algo",
+        "priority_scheduling": "priority_algo",
+        "srtf": "srtf_algo",
+        "priority_aging": "priority_aging_algo",
+        "mlfq": "mlfq_algo"
+    }
+    
+    def __init__(self, processes: Workload, n_cpus: int = 1, per_core_queues: bool = False,
+                 coalesce: bool = True):
+        """
+        Args:
+            processes: Processes to schedule, as a list or a ProcessTable
+            n_cpus: Number of simulated CPU cores
+            per_core_queues: Give each core its own ready queue instead of a shared one
+            coalesce: Merge back-to-back Gantt segments of the same process; turn
+                off for one segment per dispatched quantum
+        """
         self.processes = processes
         self.results = {}
+        self._pool = None
+        self.options = {"n_cpus": n_cpus, "per_core_queues": per_core_queues, "coalesce": coalesce}
         self.fcfs_algo = FCFSAlgorithm()
         self.sjf_algo = SJFAlgorithm()
         self.round_robin_algo = RoundRobinAlgorithm()
         self.priority_algo = PriorityAlgorithm()
+        self.srtf_algo = SRTFAlgorithm()
+        self.priority_aging_algo = PriorityAgingAlgorithm()
+        self.mlfq_algo = MLFQAlgorithm()
     
     def _clone(self):
-        """Create fresh copies of processes to avoid mutation between algorithms"""
-        return [p.clone() for p in self.processes]
+        """
+        Fresh processes for the next algorithm, leaving the caller's untouched
+        
+        A process list is copied into a ProcessTable on first use, so its
+        PIDs are interned and ranked once for every algorithm; the table is
+        reset in place afterwards. A ProcessTable shares its input columns
+        with that table but keeps its own output columns. Results already
+        hold their own copies of the per-process values.
+        """
+        if self._pool is None:
+            if isinstance(self.processes, ProcessTable):
+                table = self.processes
+                self._pool = ProcessTable.from_columns(table.names, table.pid_index, table.arrival,
+                                                       table.burst, table.priority, table.name_rank)
+            else:
+                self._pool = ProcessTable.from_processes(self.processes)
+        self._pool.reset()
+        return self._pool
     
-    def fcfs(self) -> dict:
+    def fcfs(self, include_gantt: bool = True) -> dict:
         """First Come First Served - Non-preemptive"""
-        return self.fcfs_algo.execute(self._clone())
+        return self.fcfs_algo.execute(self._clone(), include_gantt=include_gantt, **self.options)
     
     def sjf(self) -> dict:
         """Shortest Job First - Non-preemptive"""
-        return self.sjf_algo.execute(self._clone())
+        return self.sjf_algo.execute(self._clone(), **self.options)
     
-    def round_robin(self, time_quantum: int = 3) -> dict:
+    def round_robin(self, time_quantum: int = 3, fast_forward: bool = False) -> dict:
         """Round Robin - Preemptive"""
-        return self.round_robin_algo.execute(self._clone(), time_quantum=time_quantum)
+        return self.round_robin_algo.execute(self._clone(), time_quantum=time_quantum,
+                                             fast_forward=fast_forward, **self.options)
     
     def priority_scheduling(self) -> dict:
         """Priority Scheduling - Non-preemptive"""
-        return self.priority_algo.execute(self._clone())
-    
-    def run_all(self, time_quantum: int = 3) -> dict:
-        """Run all scheduling algorithms and return combined results"""
-        results = {
-            "fcfs": self.fcfs(),
-            "sjf": self.sjf(),
-            "round_robin": self.round_robin(time_quantum),
-            "priority": self.priority_scheduling()
+        return self.priority_algo.execute(self._clone(), **self.options)
+    
+    def srtf(self) -> dict:
+        """Shortest Remaining Time First - Preemptive"""
+        return self.srtf_algo.execute(self._clone(), **self.options)
+    
+    def priority_aging(self, aging_interval: int = 5) -> dict:
+        """Priority Scheduling - Preemptive with aging"""
+        return self.priority_aging_algo.execute(self._clone(), aging_interval=aging_interval,
+                                                **self.options)
+    
+    def mlfq(self, quanta: Sequence[int] = (4, 8, 16), boost_interval: Optional[int] = 100) -> dict:
+        """Multi-Level Feedback Queue - Preemptive"""
+        return self.mlfq_algo.execute(self._clone(), quanta=quanta, boost_interval=boost_interval,
+                                      **self.options)
+    
+    def resume(self, method: str, previous: dict, **kwargs) -> dict:
+        """
+        Re-run a simulator method after the workload changed
+        
+        Reuses the schedule of `previous` up to the earliest point the change
+        can affect (see BaseAlgorithm.resimulate).
+        
+        Args:
+            method: Simulator method, e.g. "round_robin"
+            previous: Its results, with the same arguments, on the old workload
+            **kwargs: The method's keyword arguments
+        """
+        algorithm = getattr(self, self.ALGORITHMS[method])
+        return algorithm.resimulate(previous, self._clone(), **kwargs, **self.options)
+    
+    def sweep_round_robin(self, quanta: Iterable[int] = range(1, 200), include_gantt: bool = False,
+                          fast_forward: bool = False, parallel: bool = True,
+                          executor: Optional[Executor] = None) -> List[dict]:
+        """
+        Run Round Robin once per time quantum and tabulate the metrics
+        
+        Each row holds the quantum, its metrics, the total time and the
+        number of dispatches (context switches plus first dispatches); the
+        Gantt chart is only kept when include_gantt is set.
+        
+        Args:
+            quanta: Time quanta to try
+            include_gantt: Add each run's "gantt_chart" to its row
+            fast_forward: Skip whole rounds instead of simulating each quantum
+            parallel: Spread the quanta over worker processes sharing the workload
+            executor: Executor to dispatch to instead of a new process pool
+                (implies parallel)
+        
+        Returns:
+            One row per quantum, in the order given
+        """
+        runs = {
+            quantum: ("_sweep_row", {"time_quantum": quantum, "include_gantt": include_gantt,
+                                     "fast_forward": fast_forward})
+            for quantum in quanta
+        }
+        for quantum in runs:
+            if quantum <= 0:
+                raise ValueError(f"Time quantum must be greater than 0, got {quantum}")
+        return list(self.run_many(runs, parallel and len(runs) > 1, executor).values())
+    
+    def _sweep_row(self, time_quantum: int, include_gantt: bool = False,
+                   fast_forward: bool = False) -> dict:
+        """One sweep_round_robin row: the run's metrics without its per-process results"""
+        result = self.round_robin_algo.execute(self._clone(), time_quantum=time_quantum,
+                                               fast_forward=fast_forward, include_gantt=include_gantt,
+                                               **self.options)
+        gantt = result["gantt_chart"]
+        row = {
+            "time_quantum": time_quantum,
+            "total_time": result["total_time"] if not include_gantt else max(gantt.ends, default=0),
+            "dispatches": result["dispatches"] if not include_gantt else gantt.dispatches,
+            **result["metrics"]
+        }
+        if include_gantt:
+            row["gantt_chart"] = gantt
+        return row
+    
+    def run_all(self, time_quantum: int = 3, parallel: bool = False,
+                executor: Optional[Executor] = None) -> dict:
+        """
+        Run all scheduling algorithms and return combined results
+        
+        Args:
+            time_quantum: Time quantum for Round Robin
+            parallel: Run each algorithm in its own worker process
+            executor: Executor to dispatch to instead of a new process pool
+                (implies parallel)
+        """
+        return self.run_many(self.all_runs(time_quantum), parallel, executor)
+    
+    @staticmethod
+    def all_runs(time_quantum: int = 3) -> Dict[str, Tuple[str, dict]]:
+        """The runs behind run_all: result key -> (simulator method name, keyword arguments)"""
+        return {
+            "fcfs": ("fcfs", {}),
+            "sjf": ("sjf", {}),
+            "round_robin": ("round_robin", {"time_quantum": time_quantum}),
+            "priority": ("priority_scheduling", {}),
+            "srtf": ("srtf", {})
         }
-        return results
+    
+    def run_many(self, runs: Dict[Hashable, Tuple[str, dict]], parallel: bool = False,
+                 executor: Optional[Executor] = None) -> dict:
+        """
+        Run several simulator methods
+        
+        Args:
+            runs: Result key -> (simulator method name, keyword arguments)
+            parallel: Run them in worker processes sharing the workload
+            executor: Executor to dispatch to instead of a new process pool
+                (implies parallel)
+        
+        Returns:
+            Result key -> result dict, in the order of runs
+        """
+        if parallel or executor is not None:
+            return self._run_parallel(runs, executor)
+        return {name: getattr(self, method)(**kwargs) for name, (method, kwargs) in runs.items()}
+    
+    def _run_parallel(self, runs: Dict[Hashable, Tuple[str, dict]], executor: Optional[Executor] = None) -> dict:
+        """
+        Run simulator methods in worker processes
+        
+        The workload is encoded once into a shared memory block that every
+        worker attaches to by name, rather than pickled into each task.
+        
+        Args:
+            runs: Result key -> (simulator method name, keyword arguments)
+            executor: Executor to use; a process pool of up to one worker per
+                run and CPU otherwise
+        
+        Returns:
+            Result key -> result dict, in the order of runs
+        """
+        data = workload_binary.to_bytes(self.processes)
+        block = shared_memory.SharedMemory(create=True, size=len(data))
+        try:
+            block.buf[:len(data)] = data
+            pool = executor or ProcessPoolExecutor(max_workers=min(len(runs), os.cpu_count() or 1))
+            try:
+                futures = {
+                    name: pool.submit(_run_shared, block.name, len(data), method, kwargs, self.options)
+                    for name, (method, kwargs) in runs.items()
+                }
+                return {name: future.result() for name, future in futures.items()}
+            finally:
+                if executor is None:
+                    pool.shutdown()
+        finally:
+            block.close()
+            block.unlink()
+
+
+# Workload shared with this worker process: block name -> (attached block, table over it)
+_attached: Dict[str, Tuple[shared_memory.SharedMemory, ProcessTable]] = {}
+# Exit hook closing the attached block; forked workers start with an empty hook registry
+_finalizer: Optional[util.Finalize] = None
+
+
+def _shared_table(block_name: str, size: int) -> ProcessTable:
+    """
+    ProcessTable over a workload shared by _run_parallel
+    
+    The block stays attached for the worker's lifetime and the table's
+    read-only input columns are views into it; simulators over the table
+    allocate their own output columns (see SchedulingSimulator._clone). A
+    block from a later _run_parallel call replaces it.
+    """
+    global _finalizer
+    if block_name not in _attached:
+        if _finalizer is None or not _finalizer.still_active():
+            # Runs at worker exit under every start method, unlike atexit
+            _finalizer = util.Finalize(None, _detach, exitpriority=0)
+        _detach()
+        block = shared_memory.SharedMemory(name=block_name)
+        _attached[block_name] = block, workload_binary.from_buffer(block.buf[:size].toreadonly())
+    return _attached[block_name][1]
+
+
+def _detach() -> None:
+    """Drop this worker's shared workload and close its block"""
+    while _attached:
+        block, table = _attached.popitem()[1]
+        # The column views must go before the block can close
+        del table
+        block.close()
+
 
+def _run_shared(block_name: str, size: int, method: str, kwargs: dict, options: dict) -> dict:
+    """Worker side of _run_parallel: run one simulator method on the shared workload"""
+    simulator = SchedulingSimulator(_shared_table(block_name, size), **options)
+    return getattr(simulator, method)(**kwargs)
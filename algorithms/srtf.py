@@ -0,0 +1,46 @@
+"""Shortest Remaining Time First Algorithm"""
+from typing import Dict, Tuple
+from models.process_table import Workload
+from .base_algorithm import BaseAlgorithm
+from .kernel import HeapPolicy, ReadyQueuePolicy
+
+
+class SRTFPolicy(HeapPolicy):
+    """Shortest remaining time first, then FCFS (arrival time), then NUMERIC PID"""
+    
+    preemptive = True
+    
+    def key(self, job: int) -> tuple:
+        kernel = self.kernel
+        return (kernel.remaining[job], kernel.arrival[job], kernel.rank[job])
+    
+    def preempts(self, job: int, now: int) -> bool:
+        # Only a strictly shorter remaining time takes the CPU
+        return bool(self.heap) and self.heap[0][0] < self.kernel.remaining[job]
+
+
+class SRTFAlgorithm(BaseAlgorithm):
+    """Shortest Remaining Time First - Preemptive SJF"""
+    
+    def build_policy(self, **kwargs) -> Tuple[str, ReadyQueuePolicy]:
+        return "SRTF", SRTFPolicy()
+    
+    def execute(self, processes: Workload, n_cpus: int = 1,
+                per_core_queues: bool = False, coalesce: bool = True, **kwargs) -> Dict:
+        """
+        Execute SRTF algorithm
+        
+        Each arrival costs one heap push plus an O(1) comparison against the
+        running process; a preempted process goes back into the heap keyed by
+        its remaining time.
+        
+        Args:
+            processes: Processes to schedule, as a list or a ProcessTable
+            n_cpus: Number of simulated CPU cores
+            per_core_queues: Give each core its own ready queue
+            coalesce: Merge back-to-back segments of the same process
+        
+        Returns:
+            Dictionary with results
+        """
+        return self.simulate(*self.build_policy(), processes, n_cpus, per_core_queues, coalesce)
@@ -4,6 +4,13 @@ Matches assignment requirements exactly
 """
 import sys
 from scheduler_fixed import SchedulingSimulator, parse_input_file
+from algorithms.scheduler import SchedulingSimulator as KernelSimulator
+from services.file_service import FileService
+from services.result_cache import ENGINE_VERSION, workload_digest
+from services.result_store import ResultStore
+
+# Engine tag of the results this CLI stores (scheduler_fixed, one Gantt segment per dispatch)
+CLI_ENGINE = f"scheduler_fixed-{ENGINE_VERSION}"
 
 
 def print_results(result):
@@ -29,17 +36,107 @@ def print_results(result):
     print(f"CPU Utilization: {result['metrics']['cpu_utilization']}%")
 
 
+def parse_quanta(spec):
+    """Parse a --tq-sweep value: START:STOP[:STEP] (STOP excluded) or a comma-separated list"""
+    if ':' in spec:
+        return range(*(int(part) for part in spec.split(':')))
+    return [int(part) for part in spec.split(',')]
+
+
+def print_sweep(rows):
+    """Print one line of Round Robin metrics per time quantum"""
+    print(f"\n{'Quantum':<8} | {'Avg Turnaround':<15} | {'Avg Waiting':<12} | "
+          f"{'P90 Waiting':<12} | {'CPU Util %':<10} | {'Dispatches':<10}")
+    print("-" * 82)
+    for row in rows:
+        print(f"{row['time_quantum']:<8} | {row['avg_turnaround_time']:<15} | {row['avg_waiting_time']:<12} | "
+              f"{row['p90_waiting_time']:<12} | {row['cpu_utilization']:<10} | {row['dispatches']:<10}")
+
+
+def run_with_store(processes, time_quantum, store_path):
+    """
+    run_all through a persistent result store
+    
+    Results already stored for this workload and quantum are looked up;
+    the others are simulated and stored.
+    """
+    runs = {
+        "fcfs": ("fcfs", {}),
+        "sjf": ("sjf", {}),
+        "round_robin": ("round_robin", {"time_quantum": time_quantum}),
+        "priority": ("priority_scheduling", {})
+    }
+    simulator = SchedulingSimulator(processes)
+    digest = workload_digest(processes)
+    results = {}
+    with ResultStore(store_path) as store:
+        for name, (method, kwargs) in runs.items():
+            result = store.get(digest, method, kwargs, CLI_ENGINE)
+            if result is None:
+                result = getattr(simulator, method)(**kwargs)
+                store.put(digest, method, kwargs, result, CLI_ENGINE)
+            results[name] = result
+    return results
+
+
 def main():
     """Main entry point for command line usage"""
-    if len(sys.argv) < 2:
-        print("Usage: python cli_main.py <input_file> [time_quantum]")
+    args = sys.argv[1:]
+    store_path = None
+    if '--store' in args:
+        position = args.index('--store')
+        if position + 1 >= len(args):
+            print("Error: --store needs a database path")
+            sys.exit(1)
+        store_path = args[position + 1]
+        del args[position:position + 2]
+    
+    sweep = None
+    if '--tq-sweep' in args:
+        position = args.index('--tq-sweep')
+        if position + 1 >= len(args):
+            print("Error: --tq-sweep needs a range (START:STOP[:STEP]) or a list of quanta")
+            sys.exit(1)
+        sweep = args[position + 1]
+        del args[position:position + 2]
+    
+    if len(args) < 1:
+        print("Usage: python cli_main.py <input_file> [time_quantum] [--store RESULTS_DB]")
+        print("       python cli_main.py <input_file> --tq-sweep START:STOP[:STEP]|Q1,Q2,...")
         print("Example: python cli_main.py processes.txt 3")
+        print("Example: python cli_main.py processes.txt 3 --store results.db")
+        print("Example: python cli_main.py processes.txt --tq-sweep 1:200")
         sys.exit(1)
     
-    input_file = sys.argv[1]
-    time_quantum = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    unknown = [arg for arg in args if arg.startswith('--')]
+    if unknown:
+        print(f"Error: Unknown option {unknown[0]}")
+        sys.exit(1)
+    if sweep is not None and store_path is not None:
+        print("Error: --store cannot be combined with --tq-sweep")
+        sys.exit(1)
+    if sweep is not None and len(args) > 1:
+        print("Error: --tq-sweep cannot be combined with a time quantum")
+        sys.exit(1)
+    if len(args) > 2:
+        print(f"Error: Unexpected argument '{args[2]}'")
+        sys.exit(1)
+    
+    input_file = args[0]
     
     try:
+        if sweep is not None:
+            # Quantum sweep over the shared, columnar workload
+            quanta = parse_quanta(sweep)
+            table = FileService.load_table(input_file)
+            if not len(table):
+                print(f"Error: No valid processes found in {input_file}")
+                sys.exit(1)
+            print_sweep(KernelSimulator(table).sweep_round_robin(quanta))
+            return
+        
+        time_quantum = int(args[1]) if len(args) > 1 else 3
+        
         # Parse processes
         processes = parse_input_file(input_file)
         
@@ -48,8 +145,11 @@ def main():
             sys.exit(1)
         
         # Run simulation
-        simulator = SchedulingSimulator(processes)
-        results = simulator.run_all(time_quantum)
+        if store_path is not None:
+            results = run_with_store(processes, time_quantum, store_path)
+        else:
+            simulator = SchedulingSimulator(processes)
+            results = simulator.run_all(time_quantum)
         
         # Print results for each algorithm
         print_results(results['fcfs'])
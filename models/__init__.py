@@ -1,6 +1,9 @@
 """Data Models Module"""
 from .process import Process
+from .process_results import ProcessResults
+from .process_table import ProcessTable
+from .gantt_trace import GanttTrace
 
-__all__ = ['Process']
+__all__ = ['Process', 'ProcessResults', 'ProcessTable', 'GanttTrace']
 
 
@@ -0,0 +1,202 @@
+"""Array-Backed Gantt Chart"""
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Optional, Tuple
+
+IDLE = "IDLE"
+PLAIN_FIELDS = {"pid", "start", "end", "dispatches"}
+
+
+class GanttTrace(Sequence):
+    """
+    Gantt chart stored as parallel int64 arrays: interned pid, start, end
+    
+    PIDs are interned into `names` (index 0 is always "IDLE"), so a segment
+    costs 24 bytes instead of a dict. Indexing and iteration yield the
+    usual {"pid", "start", "end"} dicts built on the fly, and slicing
+    returns another GanttTrace, so code written for lists of dicts keeps
+    working. Multi-core charts carry an optional `cores` column, and the
+    extra fields of records such as Round Robin "CYCLE" records are kept
+    per position in `extras`.
+    
+    With coalesce set, a segment that continues the previous one (same job,
+    starting where it ended) extends it instead; the number of dispatches
+    folded into a segment is kept in `merges` and shown as its "dispatches"
+    field. Jobs are identified by the `job` index passed to add() and
+    append(), not by PID, so distinct jobs sharing a PID stay separate;
+    segments added without one never merge.
+    """
+    
+    def __init__(self, names: Optional[List[str]] = None, coalesce: bool = False):
+        """
+        Args:
+            names: Interned PID table to share; must start with "IDLE"
+            coalesce: Merge back-to-back segments of the same job
+        """
+        self.names = names if names is not None else [IDLE]
+        self.coalesce = coalesce
+        self._index: Dict[str, int] = {}
+        self.pid_index = array('q')
+        self.starts = array('q')
+        self.ends = array('q')
+        self.cores: Optional[array] = None
+        self.extras: Dict[int, dict] = {}
+        self.merges: Dict[int, int] = {}
+        # Job of the last segment, -1 if unknown
+        self._tail_job = -1
+    
+    @staticmethod
+    def intern_all(pids: Iterable[str]) -> Tuple[List[str], List[int]]:
+        """
+        Intern a PID column
+        
+        Returns:
+            Tuple of (names table starting with "IDLE", code per PID)
+        """
+        index = {IDLE: 0}
+        codes = [index.setdefault(pid, len(index)) for pid in pids]
+        return list(index), codes
+    
+    @classmethod
+    def from_segments(cls, segments: Iterable[dict]) -> 'GanttTrace':
+        """Build a trace from Gantt segment dicts"""
+        trace = cls()
+        for segment in segments:
+            trace.append(segment)
+        return trace
+    
+    def intern(self, pid: str) -> int:
+        """Code of a PID in the names table, adding it if new"""
+        if len(self._index) != len(self.names):
+            self._index = {name: code for code, name in enumerate(self.names)}
+        code = self._index.get(pid)
+        if code is None:
+            code = self._index[pid] = len(self.names)
+            self.names.append(pid)
+        return code
+    
+    def add(self, code: int, start: int, end: int, job: int = -1) -> None:
+        """Append a segment by interned pid code and, for coalescing, the job it belongs to"""
+        if self.coalesce and job >= 0 and job == self._tail_job and self.ends[-1] == start:
+            position = len(self.pid_index) - 1
+            self.ends[position] = end
+            self.merges[position] = self.merges.get(position, 1) + 1
+            return
+        self._tail_job = job
+        self.pid_index.append(code)
+        self.starts.append(start)
+        self.ends.append(end)
+    
+    def append(self, segment: dict, job: int = -1) -> None:
+        """Append a Gantt segment dict of `job`; keys beyond pid/start/end are kept too"""
+        position = len(self.pid_index)
+        dispatches = segment.get("dispatches", 1)
+        if segment.keys() <= PLAIN_FIELDS and self.cores is None:
+            # Plain segment: goes through add() so it may extend the previous one
+            self.add(self.intern(segment["pid"]), segment["start"], segment["end"], job)
+            if dispatches > 1:
+                last = len(self.pid_index) - 1
+                self.merges[last] = self.merges.get(last, 1) + dispatches - 1
+            return
+        
+        self._tail_job = -1
+        self.pid_index.append(self.intern(segment["pid"]))
+        self.starts.append(segment["start"])
+        self.ends.append(segment["end"])
+        if "core" in segment:
+            if self.cores is None:
+                self.cores = array('q', bytes(8 * position))
+            self.cores.append(segment["core"])
+        elif self.cores is not None:
+            self.cores.append(0)
+        if dispatches > 1:
+            self.merges[position] = dispatches
+        extra = {key: value for key, value in segment.items()
+                 if key not in PLAIN_FIELDS and key != "core"}
+        if extra:
+            self.extras[position] = extra
+    
+    def extend(self, segments: Iterable[dict]) -> None:
+        if (not isinstance(segments, GanttTrace) or len(segments) < 2 or segments.cores is not None
+                or (self.coalesce and not segments.coalesce)):
+            for segment in segments:
+                self.append(segment)
+            return
+        
+        # Another trace: the first segment may extend our last one, the rest are copied column-wise
+        self.append(segments[0])
+        offset = len(self.pid_index) - 1
+        codes = segments.pid_index[1:]
+        recode = {code: self.intern(segments.names[code]) for code in set(codes)}
+        self.pid_index.extend(array('q', map(recode.__getitem__, codes)))
+        self.starts.extend(segments.starts[1:])
+        self.ends.extend(segments.ends[1:])
+        if self.cores is not None:
+            self.cores.extend(array('q', bytes(8 * (len(segments) - 1))))
+        self.extras.update((offset + position, extra) for position, extra in segments.extras.items() if position)
+        self.merges.update((offset + position, count) for position, count in segments.merges.items() if position)
+        self._tail_job = -1
+    
+    def __len__(self) -> int:
+        return len(self.pid_index)
+    
+    @property
+    def dispatches(self) -> int:
+        """Process dispatches behind the trace, counting those merged by coalescing or in cycle records"""
+        segments = sum(1 for code in self.pid_index if code)
+        cycles = sum(len(extra["cycle"]) * extra["rounds"] - 1 for extra in self.extras.values() if "cycle" in extra)
+        return segments + sum(self.merges.values()) - len(self.merges) + cycles
+    
+    def _segment(self, position: int) -> dict:
+        segment = {
+            "pid": self.names[self.pid_index[position]],
+            "start": self.starts[position],
+            "end": self.ends[position]
+        }
+        if self.cores is not None:
+            segment["core"] = self.cores[position]
+        if position in self.merges:
+            segment["dispatches"] = self.merges[position]
+        if position in self.extras:
+            segment.update(self.extras[position])
+        return segment
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            positions = range(len(self))[index]
+            trace = GanttTrace(self.names, self.coalesce)
+            trace.pid_index = self.pid_index[index]
+            trace.starts = self.starts[index]
+            trace.ends = self.ends[index]
+            if self.cores is not None:
+                trace.cores = self.cores[index]
+            if positions.step == 1:
+                # Contiguous slice: shift the sparse entries instead of scanning every position
+                first = positions.start
+                trace.extras = {old - first: extra for old, extra in self.extras.items() if old in positions}
+                trace.merges = {old - first: count for old, count in self.merges.items() if old in positions}
+            else:
+                trace.extras = {new: self.extras[old] for new, old in enumerate(positions) if old in self.extras}
+                trace.merges = {new: self.merges[old] for new, old in enumerate(positions) if old in self.merges}
+            return trace
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("GanttTrace index out of range")
+        return self._segment(index)
+    
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self._segment(position)
+    
+    def to_list(self) -> List[dict]:
+        """The trace as a plain list of segment dicts"""
+        return list(self)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (GanttTrace, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"GanttTrace({len(self)} segments)"
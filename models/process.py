@@ -1,21 +1,49 @@
 """Process Data Model"""
-from dataclasses import dataclass
 
 
-@dataclass
 class Process:
-    """Represents a process with all its attributes"""
-    pid: str
-    arrival_time: int
-    burst_time: int
-    priority: int
-    remaining_time: int = 0
-    finish_time: int = 0
-    turnaround_time: int = 0
-    waiting_time: int = 0
-    
-    def __post_init__(self):
+    """
+    Represents a process with all its attributes
+    
+    Slotted (no per-instance __dict__) so large workloads stay compact.
+    remaining_time always starts at burst_time; reset() restores that state
+    in place so the same objects can be scheduled again.
+    """
+    
+    __slots__ = ("pid", "arrival_time", "burst_time", "priority",
+                 "remaining_time", "finish_time", "turnaround_time", "waiting_time")
+    
+    def __init__(self, pid: str, arrival_time: int, burst_time: int, priority: int,
+                 remaining_time: int = 0, finish_time: int = 0,
+                 turnaround_time: int = 0, waiting_time: int = 0):
+        self.pid = pid
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.remaining_time = burst_time
+        self.finish_time = finish_time
+        self.turnaround_time = turnaround_time
+        self.waiting_time = waiting_time
+    
+    def __repr__(self) -> str:
+        return (f"Process(pid={self.pid!r}, arrival_time={self.arrival_time}, "
+                f"burst_time={self.burst_time}, priority={self.priority}, "
+                f"remaining_time={self.remaining_time}, finish_time={self.finish_time}, "
+                f"turnaround_time={self.turnaround_time}, waiting_time={self.waiting_time})")
+    
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None
+    
+    def reset(self) -> None:
+        """Restore the remaining time and clear scheduling outputs in place"""
         self.remaining_time = self.burst_time
+        self.finish_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
     
     def to_dict(self) -> dict:
         """Convert process to dictionary"""
@@ -31,11 +59,10 @@ class Process:
     
     def clone(self):
         """Create a fresh copy of the process"""
-        return Process(
-            pid=self.pid,
-            arrival_time=self.arrival_time,
-            burst_time=self.burst_time,
-            priority=self.priority
-        )
-
-
+        copy = Process.__new__(Process)
+        copy.pid = self.pid
+        copy.arrival_time = self.arrival_time
+        copy.burst_time = self.burst_time
+        copy.priority = self.priority
+        copy.reset()
+        return copy
@@ -0,0 +1,55 @@
+"""Columnar Per-Process Results"""
+from collections.abc import Sequence
+from typing import Dict, List, Optional
+
+
+class ProcessResults(Sequence):
+    """
+    Per-process results stored as columns, in natural PID order
+    
+    Columns are NumPy arrays when NumPy is available (plain lists otherwise)
+    and can be reduced directly through `columns`. Indexing or iterating
+    yields the same dicts as Process.to_dict(); they are built on first
+    access and cached.
+    """
+    
+    FIELDS = ("pid", "arrival_time", "burst_time", "priority",
+              "finish_time", "turnaround_time", "waiting_time")
+    
+    def __init__(self, columns: Dict[str, Sequence]):
+        """
+        Args:
+            columns: One equally long sequence per name in FIELDS
+        """
+        self.columns = columns
+        self._rows: Optional[List[dict]] = None
+    
+    @property
+    def rows(self) -> List[dict]:
+        """Per-process dicts, materialised on first use"""
+        if self._rows is None:
+            values = [
+                column.tolist() if hasattr(column, "tolist") else column
+                for column in (self.columns[field] for field in self.FIELDS)
+            ]
+            self._rows = [dict(zip(self.FIELDS, row)) for row in zip(*values)]
+        return self._rows
+    
+    def __len__(self) -> int:
+        return len(self.columns["pid"])
+    
+    def __getitem__(self, index):
+        return self.rows[index]
+    
+    def __iter__(self):
+        return iter(self.rows)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ProcessResults):
+            return self.rows == other.rows
+        if isinstance(other, list):
+            return self.rows == other
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"ProcessResults({len(self)} processes)"
@@ -0,0 +1,218 @@
+"""Columnar Process Workload"""
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from utils.pid_utils import natural_ranks
+from .process import Process
+
+# An int64 column: array('q') or a 'q'-format memoryview
+Column = Union[array, memoryview]
+
+
+class ProcessTable:
+    """
+    A workload stored as one typed column per process attribute
+    
+    Each row is a process. PID strings are kept once in `names` and rows
+    refer to them through the `pid_index` column, so engines work with
+    integer codes and the natural sort order of `name_rank`; the numeric
+    columns are int64 `array.array`s, which NumPy can view without
+    copying. Algorithms write finish/turnaround/waiting into the columns,
+    and reset() restores the table for the next run instead of cloning it.
+    """
+    
+    # Process attribute -> column name
+    FIELDS = {
+        "arrival_time": "arrival",
+        "burst_time": "burst",
+        "priority": "priority",
+        "remaining_time": "remaining",
+        "finish_time": "finish",
+        "turnaround_time": "turnaround",
+        "waiting_time": "waiting"
+    }
+    
+    def __init__(self, pids: Iterable[str], arrival_times: Iterable[int],
+                 burst_times: Iterable[int], priorities: Iterable[int]):
+        """
+        Args:
+            pids: Process IDs, one per row
+            arrival_times: Arrival time per row
+            burst_times: Burst time per row
+            priorities: Priority per row
+        """
+        pids = list(pids)
+        self.names: List[str] = list(dict.fromkeys(pids))
+        if len(self.names) == len(pids):
+            # All PIDs distinct: row i is name i
+            self.pid_index = array('q', range(len(pids)))
+        else:
+            index: Dict[str, int] = {pid: code for code, pid in enumerate(self.names)}
+            self.pid_index = array('q', map(index.__getitem__, pids))
+        
+        self.arrival = array('q', arrival_times)
+        self.burst = array('q', burst_times)
+        self.priority = array('q', priorities)
+        self._name_rank: Optional[array] = None
+        self._allocate_outputs()
+    
+    @classmethod
+    def from_columns(cls, names: List[str], pid_index: Column, arrival: Column,
+                     burst: Column, priority: Column,
+                     name_rank: Optional[array] = None) -> 'ProcessTable':
+        """
+        Adopt existing int64 input columns without copying them
+        
+        The columns may be arrays or 'q'-format memoryviews, e.g. over a
+        memory-mapped workload file; only the output columns are allocated.
+        
+        Args:
+            names: Interned PID strings
+            pid_index: Index into names per row
+            arrival: Arrival time per row
+            burst: Burst time per row
+            priority: Priority per row
+            name_rank: name_rank of another table with the same names, to reuse
+        """
+        table = cls.__new__(cls)
+        table.names = names
+        table.pid_index = pid_index
+        table.arrival = arrival
+        table.burst = burst
+        table.priority = priority
+        table._name_rank = name_rank
+        table._allocate_outputs()
+        return table
+    
+    def _allocate_outputs(self) -> None:
+        if not len(self.arrival) == len(self.burst) == len(self.priority) == len(self.pid_index):
+            raise ValueError("All ProcessTable columns must have the same length")
+        self.remaining = _copy(self.burst)
+        self.finish = array('q', bytes(8 * len(self.burst)))
+        self.turnaround = array('q', self.finish)
+        self.waiting = array('q', self.finish)
+    
+    @classmethod
+    def from_processes(cls, processes: Sequence[Process]) -> 'ProcessTable':
+        """Build a table from Process objects (their inputs only)"""
+        return cls(
+            (p.pid for p in processes),
+            (p.arrival_time for p in processes),
+            (p.burst_time for p in processes),
+            (p.priority for p in processes)
+        )
+    
+    def __len__(self) -> int:
+        return len(self.pid_index)
+    
+    @property
+    def name_rank(self) -> array:
+        """Natural-sort rank of every name (see natural_ranks), computed on first use"""
+        if self._name_rank is None:
+            self._name_rank = natural_ranks(self.names)
+        return self._name_rank
+    
+    @property
+    def pids(self) -> List[str]:
+        """PID string of every row"""
+        names = self.names
+        return [names[i] for i in self.pid_index]
+    
+    def reset(self) -> None:
+        """Restore remaining times and clear the outputs of a previous run in place"""
+        self.remaining[:] = _copy(self.burst)
+        zeros = array('q', bytes(8 * len(self.burst)))
+        self.finish[:] = zeros
+        self.turnaround[:] = zeros
+        self.waiting[:] = zeros
+    
+    def store(self, remaining: Sequence[int], finish: Sequence[int]) -> None:
+        """
+        Record the outcome of a run
+        
+        Args:
+            remaining: Remaining time per row
+            finish: Finish time per row
+        """
+        self.remaining[:] = array('q', remaining)
+        self.finish[:] = array('q', finish)
+        self.turnaround[:] = array('q', map(int.__sub__, self.finish, self.arrival))
+        self.waiting[:] = array('q', map(int.__sub__, self.turnaround, self.burst))
+    
+    def to_processes(self) -> List[Process]:
+        """Materialise the rows as Process objects, outputs included"""
+        processes = []
+        for row, pid in enumerate(self.pids):
+            proc = Process(pid, self.arrival[row], self.burst[row], self.priority[row])
+            proc.remaining_time = self.remaining[row]
+            proc.finish_time = self.finish[row]
+            proc.turnaround_time = self.turnaround[row]
+            proc.waiting_time = self.waiting[row]
+            processes.append(proc)
+        return processes
+
+
+def _copy(column: Column) -> array:
+    """Mutable int64 copy of a column, made with one memcpy"""
+    copy = array('q')
+    copy.frombytes(memoryview(column).cast('B'))
+    return copy
+
+
+# Anything the algorithms accept as input
+Workload = Union[List[Process], ProcessTable]
+
+
+def workload_columns(workload: Workload) -> Tuple[List[str], List[int], List[int], List[int]]:
+    """
+    Input columns of a workload as plain lists
+    
+    Returns:
+        Tuple of (pids, arrival times, burst times, priorities)
+    """
+    pids = workload.pids if isinstance(workload, ProcessTable) else [p.pid for p in workload]
+    return (pids, *workload_times(workload))
+
+
+def workload_times(workload: Workload) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Numeric input columns of a workload as plain lists
+    
+    Returns:
+        Tuple of (arrival times, burst times, priorities)
+    """
+    if isinstance(workload, ProcessTable):
+        return workload.arrival.tolist(), workload.burst.tolist(), workload.priority.tolist()
+    return (
+        [p.arrival_time for p in workload],
+        [p.burst_time for p in workload],
+        [p.priority for p in workload]
+    )
+
+
+def workload_pids(workload: Workload) -> Tuple[List[str], List[int], array]:
+    """
+    Interned PIDs of a workload
+    
+    A ProcessTable's are used as they are; a process list is interned here.
+    
+    Returns:
+        Tuple of (distinct PIDs, index into them per row, natural-sort rank per distinct PID)
+    """
+    if isinstance(workload, ProcessTable):
+        return workload.names, workload.pid_index.tolist(), workload.name_rank
+    index: Dict[str, int] = {}
+    codes = [index.setdefault(p.pid, len(index)) for p in workload]
+    names = list(index)
+    return names, codes, natural_ranks(names)
+
+
+def store_schedule(workload: Workload, remaining: Sequence[int], finish: Sequence[int]) -> None:
+    """Write remaining/finish times back and derive turnaround and waiting times"""
+    if isinstance(workload, ProcessTable):
+        workload.store(remaining, finish)
+        return
+    for proc, left, done in zip(workload, remaining, finish):
+        proc.remaining_time = left
+        proc.finish_time = done
+        proc.turnaround_time = done - proc.arrival_time
+        proc.waiting_time = proc.turnaround_time - proc.burst_time
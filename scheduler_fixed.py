@@ -3,10 +3,10 @@ CPU Process Scheduling Simulator - CORRECTED VERSION
 All algorithms fixed with proper tie-breaking and queue management
 """
 
-from dataclasses import dataclass
 from typing import List, Tuple
 import json
 import re
+from utils.workload_parser import read_columns
 
 def pid_key(pid: str):
     """Extract numeric part of PID for proper sorting (P10 > P2, not P10 < P2)
@@ -20,20 +20,42 @@ def pid_key(pid: str):
     else:
         return (1, pid)  # Non-numeric PIDs come after, sorted alphabetically
 
-@dataclass
 class Process:
-    """Represents a process with all its attributes"""
-    pid: str
-    arrival_time: int
-    burst_time: int
-    priority: int
-    remaining_time: int = 0
-    finish_time: int = 0
-    turnaround_time: int = 0
-    waiting_time: int = 0
+    """Represents a process with all its attributes (slotted, reusable via reset())"""
+    __slots__ = ("pid", "arrival_time", "burst_time", "priority",
+                 "remaining_time", "finish_time", "turnaround_time", "waiting_time")
     
-    def __post_init__(self):
+    def __init__(self, pid: str, arrival_time: int, burst_time: int, priority: int,
+                 remaining_time: int = 0, finish_time: int = 0,
+                 turnaround_time: int = 0, waiting_time: int = 0):
+        self.pid = pid
+        self.arrival_time = arrival_time
+        self.burst_time = burst_time
+        self.priority = priority
+        self.remaining_time = burst_time
+        self.finish_time = finish_time
+        self.turnaround_time = turnaround_time
+        self.waiting_time = waiting_time
+    
+    def __repr__(self):
+        return (f"Process(pid={self.pid!r}, arrival_time={self.arrival_time}, "
+                f"burst_time={self.burst_time}, priority={self.priority}, "
+                f"remaining_time={self.remaining_time}, finish_time={self.finish_time}, "
+                f"turnaround_time={self.turnaround_time}, waiting_time={self.waiting_time})")
+    
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+    
+    __hash__ = None
+    
+    def reset(self):
+        """Restore the remaining time and clear scheduling outputs in place"""
         self.remaining_time = self.burst_time
+        self.finish_time = 0
+        self.turnaround_time = 0
+        self.waiting_time = 0
 
 class SchedulingSimulator:
     """Main simulator class for all scheduling algorithms"""
@@ -41,11 +63,17 @@ class SchedulingSimulator:
     def __init__(self, processes: List[Process]):
         self.processes = processes
         self.results = {}
+        self._pool = None
     
     def _clone(self):
-        """Create fresh copies of processes to avoid mutation between algorithms"""
-        return [Process(p.pid, p.arrival_time, p.burst_time, p.priority) 
-                for p in self.processes]
+        """Fresh processes for the next algorithm: one private copy, reset in place on reuse"""
+        if self._pool is None:
+            self._pool = [Process(p.pid, p.arrival_time, p.burst_time, p.priority)
+                          for p in self.processes]
+        else:
+            for p in self._pool:
+                p.reset()
+        return list(self._pool)
     
     def fcfs(self) -> dict:
         """First Come First Served - Non-preemptive"""
@@ -293,21 +321,9 @@ class SchedulingSimulator:
 
 def parse_input_file(filename: str) -> List[Process]:
     """Parse input file and return list of processes"""
-    processes = []
-    with open(filename, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            parts = [p.strip() for p in line.split(',')]
-            if len(parts) >= 4:
-                processes.append(Process(
-                    pid=parts[0],
-                    arrival_time=int(parts[1]),
-                    burst_time=int(parts[2]),
-                    priority=int(parts[3])
-                ))
-    return processes
+    # Bulk block parser; '#' comment lines are skipped
+    pids, arrival, burst, priority = read_columns(filename)
+    return [Process(*row) for row in zip(pids, arrival, burst, priority)]
 
 
 def main():
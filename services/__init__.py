@@ -2,7 +2,9 @@
 from .process_service import ProcessService
 from .simulation_service import SimulationService
 from .file_service import FileService
+from .result_cache import ResultCache
+from .result_store import ResultStore
 
-__all__ = ['ProcessService', 'SimulationService', 'FileService']
+__all__ = ['ProcessService', 'SimulationService', 'FileService', 'ResultCache', 'ResultStore']
 
 
@@ -1,6 +1,9 @@
 """File I/O Service"""
-from typing import List
+from typing import Iterator, List
 from models.process import Process
+from models.process_table import ProcessTable, Workload
+from utils import workload_binary
+from utils.workload_parser import DEFAULT_BLOCK_SIZE, Columns, iter_columns, read_columns
 
 
 class FileService:
@@ -14,26 +17,40 @@ class FileService:
         Expected format: pid,arrival_time,burst_time,priority
         Lines starting with # are ignored
         """
-        processes = []
+        pids, arrival, burst, priority = FileService._read(filepath)
+        return [Process(*row) for row in zip(pids, arrival, burst, priority)]
+    
+    @staticmethod
+    def load_table(filepath: str, block_size: int = DEFAULT_BLOCK_SIZE) -> ProcessTable:
+        """
+        Load a workload file straight into a columnar ProcessTable
+        
+        Same format as load_from_file, parsed in large blocks without
+        creating a Process per line.
+        """
+        return ProcessTable(*FileService._read(filepath, block_size))
+    
+    @staticmethod
+    def iter_chunks(filepath: str, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[ProcessTable]:
+        """
+        Lazily load a workload file as one ProcessTable per block read
+        
+        Args:
+            filepath: Path of the workload file
+            block_size: Characters read per block
+        """
         try:
-            with open(filepath, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    parts = [p.strip() for p in line.split(',')]
-                    if len(parts) >= 4:
-                        processes.append(Process(
-                            pid=parts[0],
-                            arrival_time=int(parts[1]),
-                            burst_time=int(parts[2]),
-                            priority=int(parts[3])
-                        ))
+            for columns in iter_columns(filepath, block_size):
+                yield ProcessTable(*columns)
+        except Exception as e:
+            raise ValueError(f"Failed to load file: {str(e)}")
+    
+    @staticmethod
+    def _read(filepath: str, block_size: int = DEFAULT_BLOCK_SIZE) -> Columns:
+        try:
+            return read_columns(filepath, block_size)
         except Exception as e:
             raise ValueError(f"Failed to load file: {str(e)}")
-        
-        return processes
     
     @staticmethod
     def save_to_file(filepath: str, processes: List[Process]) -> None:
@@ -44,5 +61,24 @@ class FileService:
                     f.write(f"{proc.pid},{proc.arrival_time},{proc.burst_time},{proc.priority}\n")
         except Exception as e:
             raise ValueError(f"Failed to save file: {str(e)}")
-
-
+    
+    @staticmethod
+    def save_binary(filepath: str, processes: Workload) -> None:
+        """Save a workload in the binary format (see utils.workload_binary)"""
+        try:
+            workload_binary.save_table(filepath, processes)
+        except Exception as e:
+            raise ValueError(f"Failed to save file: {str(e)}")
+    
+    @staticmethod
+    def load_binary(filepath: str) -> ProcessTable:
+        """
+        Load a binary workload file as a ProcessTable
+        
+        The file is memory-mapped and the input columns are used in place,
+        so loading costs little beyond decoding the PID table.
+        """
+        try:
+            return workload_binary.load_table(filepath)
+        except Exception as e:
+            raise ValueError(f"Failed to load file: {str(e)}")
@@ -1,13 +1,47 @@
 """Process Management Service"""
-from typing import List, Optional
+import gc
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from models.process import Process
+from models.process_table import ProcessTable
+
+# A process to add: a Process or a (pid, arrival_time, burst_time, priority) tuple
+ProcessRow = Union[Process, Tuple[str, int, int, int]]
+
+
+@contextmanager
+def _gc_paused():
+    """Pause the cyclic GC, which would otherwise rescan every new Process during bulk loads"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
 
 
 class ProcessService:
-    """Manages process operations"""
+    """
+    Manages process operations
+    
+    Processes are kept in a dict keyed by PID, in insertion order, so
+    lookups, duplicate checks and removals do not scan the collection.
+    The collection is only changed through the methods below; `processes`
+    is a read-only snapshot.
+    """
     
     def __init__(self):
-        self.processes: List[Process] = []
+        self._index: Dict[str, Process] = {}
+    
+    @property
+    def processes(self) -> Tuple[Process, ...]:
+        """
+        All processes in insertion order, as a tuple
+        
+        No longer a list: add, remove or clear processes through the methods.
+        """
+        return tuple(self._index.values())
     
     def add_process(self, pid: str, arrival_time: int, burst_time: int, priority: int) -> bool:
         """
@@ -16,42 +50,78 @@ class ProcessService:
         Returns:
             True if added successfully, False if PID already exists
         """
-        if self.get_process_by_pid(pid) is not None:
+        if pid in self._index:
             return False
         
-        process = Process(pid, arrival_time, burst_time, priority)
-        self.processes.append(process)
+        self._index[pid] = Process(pid, arrival_time, burst_time, priority)
         return True
     
+    def add_many(self, rows: Iterable[ProcessRow]) -> int:
+        """
+        Add many processes in one pass
+        
+        Same result as calling add_process for each row in order: a PID that
+        already exists, or appears earlier in `rows`, is skipped.
+        
+        Args:
+            rows: Process objects or (pid, arrival_time, burst_time, priority) tuples
+        
+        Returns:
+            Number of processes added
+        """
+        index = self._index
+        before = len(index)
+        with _gc_paused():
+            for row in rows:
+                if isinstance(row, Process):
+                    row = (row.pid, row.arrival_time, row.burst_time, row.priority)
+                if row[0] not in index:
+                    index[row[0]] = Process(*row)
+        return len(index) - before
+    
+    def load_table(self, table: ProcessTable) -> int:
+        """
+        Add every row of a ProcessTable, skipping duplicate PIDs like add_many
+        
+        Args:
+            table: Workload loaded with FileService.load_table or load_binary
+        
+        Returns:
+            Number of processes added
+        """
+        index = self._index
+        before = len(index)
+        columns = (table.pids, table.arrival.tolist(), table.burst.tolist(), table.priority.tolist())
+        with _gc_paused():
+            if not index and len(table.names) == len(table):
+                # Nothing to clash with: build the index in one go
+                index.update(zip(columns[0], map(Process, *columns)))
+            else:
+                for row in zip(*columns):
+                    if row[0] not in index:
+                        index[row[0]] = Process(*row)
+        return len(index) - before
+    
     def remove_process(self, pid: str) -> bool:
         """Remove a process by PID"""
-        process = self.get_process_by_pid(pid)
-        if process:
-            self.processes.remove(process)
-            return True
-        return False
+        return self._index.pop(pid, None) is not None
     
     def get_process_by_pid(self, pid: str) -> Optional[Process]:
         """Get a process by PID"""
-        for proc in self.processes:
-            if proc.pid == pid:
-                return proc
-        return None
+        return self._index.get(pid)
     
     def clear_all(self) -> None:
         """Clear all processes"""
-        self.processes.clear()
+        self._index.clear()
     
     def get_all(self) -> List[Process]:
         """Get all processes"""
-        return self.processes.copy()
+        return list(self._index.values())
     
     def count(self) -> int:
         """Get number of processes"""
-        return len(self.processes)
+        return len(self._index)
     
     def has_processes(self) -> bool:
         """Check if there are any processes"""
-        return len(self.processes) > 0
-
-
+        return len(self._index) > 0
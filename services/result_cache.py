@@ -0,0 +1,168 @@
+"""Simulation Result Cache"""
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+from models.process_table import Workload
+from utils import workload_binary
+
+# Part of every key; bump when a change to the engines alters their results
+ENGINE_VERSION = 1
+
+
+def workload_digest(workload: Workload) -> str:
+    """Stable SHA-256 of a workload's input columns (PIDs, arrival, burst, priority)"""
+    return hashlib.sha256(workload_binary.to_bytes(workload)).hexdigest()
+
+
+def result_key(digest: str, method: str, params: dict) -> str:
+    """
+    Cache key of one simulation
+    
+    Args:
+        digest: workload_digest() of the workload
+        method: Simulator method that produced the result
+        params: Its arguments and the simulator options
+    """
+    text = json.dumps([ENGINE_VERSION, digest, method, params], sort_keys=True)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    LRU cache of simulation results with an optional on-disk tier
+    
+    Results are returned as stored, not copied, so callers must treat them
+    as read-only. Entries evicted from memory stay on disk when a directory
+    is given; disk hits are promoted back into memory. The disk tier is
+    capped at max_disk_bytes, dropping the least recently used files first.
+    
+    The disk tier is read back with pickle, which runs whatever code a file
+    tells it to: only point `directory` at a directory that no untrusted
+    user or process can write to.
+    """
+    
+    def __init__(self, max_entries: int = 64, directory: Optional[str] = None,
+                 max_disk_bytes: int = 256 * 2 ** 20):
+        """
+        Args:
+            max_entries: Results kept in memory
+            directory: Trusted directory for the on-disk tier (disabled if None)
+            max_disk_bytes: Total size the on-disk tier is pruned down to
+        """
+        if max_entries <= 0:
+            raise ValueError(f"Cache size must be greater than 0, got {max_entries}")
+        if max_disk_bytes <= 0:
+            raise ValueError(f"Disk cache size must be greater than 0, got {max_disk_bytes}")
+        self.max_entries = max_entries
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = directory
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        # Bytes in the disk tier as last counted, plus what this cache wrote since
+        self._disk_bytes = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+    
+    def get(self, key: str) -> Optional[dict]:
+        """Cached result for a key, or None"""
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+        result = self._load(key)
+        if result is not None:
+            self.disk_hits += 1
+            self._remember(key, result)
+            return result
+        self.misses += 1
+        return None
+    
+    def put(self, key: str, result: dict) -> None:
+        """Store a result in memory and, if enabled, on disk"""
+        self._remember(key, result)
+        if self.directory is not None:
+            path = self._path(key)
+            with open(path + '.tmp', 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + '.tmp', path)
+            self._disk_bytes += os.path.getsize(path)
+            if self._disk_bytes > self.max_disk_bytes:
+                self._prune(path)
+    
+    def clear(self) -> None:
+        """Drop the in-memory entries (the disk tier is kept)"""
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and the number of results in memory"""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": len(self._entries)
+        }
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _remember(self, key: str, result: dict) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.pickle')
+    
+    def _disk_files(self) -> List[Tuple[float, int, str]]:
+        """(last use, size, path) of every result file in the disk tier"""
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith('.pickle'):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+        return files
+    
+    def _prune(self, keep: str) -> None:
+        """Delete the least recently used result files until the disk tier fits, sparing `keep`"""
+        files = self._disk_files()
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                # Already removed, e.g. by another cache sharing the directory
+                pass
+            total -= size
+        self._disk_bytes = total
+    
+    def _load(self, key: str) -> Optional[dict]:
+        if self.directory is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+        try:
+            # Mark the file as recently used for _prune
+            os.utime(path)
+        except OSError:
+            pass
+        return result
@@ -0,0 +1,231 @@
+"""Persistent SQLite Result Store"""
+import json
+import sqlite3
+import time
+import zlib
+from array import array
+from typing import Dict, List, Optional
+from models.gantt_trace import GanttTrace
+from models.process_results import ProcessResults
+from .result_cache import ENGINE_VERSION
+
+try:
+    import numpy as np
+except ImportError:  # Optional - per-process columns come back as lists
+    np = None
+
+# Engine tag of results produced by the simulation kernel
+DEFAULT_ENGINE = f"kernel-{ENGINE_VERSION}"
+
+# Metrics kept in their own columns so they can be queried without unpacking results
+METRIC_COLUMNS = (
+    "avg_turnaround_time", "avg_waiting_time", "cpu_utilization",
+    "min_turnaround_time", "max_turnaround_time", "p50_turnaround_time",
+    "p90_turnaround_time", "p99_turnaround_time",
+    "min_waiting_time", "max_waiting_time", "p50_waiting_time",
+    "p90_waiting_time", "p99_waiting_time"
+)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS results (
+    workload_digest TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    params TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    algorithm_name TEXT,
+    created_at REAL NOT NULL,
+    {', '.join(f'{column} REAL' for column in METRIC_COLUMNS)},
+    gantt BLOB NOT NULL,
+    result BLOB NOT NULL,
+    PRIMARY KEY (workload_digest, algorithm, params, engine)
+);
+CREATE INDEX IF NOT EXISTS results_by_algorithm ON results (algorithm, engine);
+CREATE INDEX IF NOT EXISTS results_by_turnaround ON results (avg_turnaround_time);
+CREATE INDEX IF NOT EXISTS results_by_waiting ON results (avg_waiting_time);
+CREATE INDEX IF NOT EXISTS results_by_utilization ON results (cpu_utilization);
+"""
+
+
+def _encode(value):
+    """JSON-ready form of a result value; GanttTraces and ProcessResults are tagged for _decode"""
+    if isinstance(value, GanttTrace):
+        return {"__gantt_trace__": {
+            "names": value.names,
+            "coalesce": value.coalesce,
+            "pid_index": value.pid_index.tolist(),
+            "starts": value.starts.tolist(),
+            "ends": value.ends.tolist(),
+            "cores": value.cores.tolist() if value.cores is not None else None,
+            "extras": [[position, extra] for position, extra in value.extras.items()],
+            "merges": [[position, count] for position, count in value.merges.items()]
+        }}
+    if isinstance(value, ProcessResults):
+        return {"__process_results__": {field: _encode(column) for field, column in value.columns.items()}}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if hasattr(value, "tolist"):
+        # NumPy arrays and scalars
+        return value.tolist()
+    return value
+
+
+def _decode(obj: dict):
+    """json.loads object hook undoing _encode"""
+    if "__gantt_trace__" in obj:
+        data = obj["__gantt_trace__"]
+        trace = GanttTrace(data["names"], data["coalesce"])
+        trace.pid_index = array('q', data["pid_index"])
+        trace.starts = array('q', data["starts"])
+        trace.ends = array('q', data["ends"])
+        if data["cores"] is not None:
+            trace.cores = array('q', data["cores"])
+        trace.extras = {position: extra for position, extra in data["extras"]}
+        trace.merges = {position: count for position, count in data["merges"]}
+        return trace
+    if "__process_results__" in obj:
+        columns = obj["__process_results__"]
+        if np is not None:
+            for field in ProcessResults.FIELDS[1:]:
+                columns[field] = np.array(columns[field], dtype=np.int64)
+        return ProcessResults(columns)
+    return obj
+
+
+def _pack(value) -> bytes:
+    return zlib.compress(json.dumps(_encode(value), separators=(',', ':')).encode('utf-8'))
+
+
+def _unpack(blob: bytes):
+    return json.loads(zlib.decompress(blob), object_hook=_decode)
+
+
+class ResultStore:
+    """
+    Simulation results persisted in an SQLite database
+    
+    One row per (workload digest, algorithm, parameters, engine). The
+    metrics are stored in indexed columns for querying across runs; the
+    Gantt chart and the rest of the result dict are kept as compressed
+    JSON blobs and only unpacked by get(). Being JSON, a blob cannot run
+    code when read; rows that do not decode (e.g. pickled by older
+    versions) count as misses and are replaced by the next put().
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Database file, created if missing
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, digest: str, algorithm: str, params: dict,
+            engine: str = DEFAULT_ENGINE) -> Optional[dict]:
+        """
+        Stored result of a simulation, or None
+        
+        Args:
+            digest: workload_digest() of the workload
+            algorithm: Algorithm (simulator method) that produced the result
+            params: Its parameters and the simulator options
+            engine: Engine tag the result must come from
+        """
+        row = self.connection.execute(
+            "SELECT gantt, result FROM results"
+            " WHERE workload_digest = ? AND algorithm = ? AND params = ? AND engine = ?",
+            (digest, algorithm, json.dumps(params, sort_keys=True), engine)
+        ).fetchone()
+        result = None
+        if row is not None:
+            try:
+                result = _unpack(row[1])
+                result["gantt_chart"] = _unpack(row[0])
+            except (zlib.error, ValueError):
+                # Not written by this version, e.g. a pickled row
+                result = None
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+    
+    def put(self, digest: str, algorithm: str, params: dict, result: dict,
+            engine: str = DEFAULT_ENGINE) -> None:
+        """
+        Store (or replace) the result of a simulation
+        
+        Args:
+            digest: workload_digest() of the workload
+            algorithm: Algorithm (simulator method) that produced the result
+            params: Its parameters and the simulator options
+            result: Result dict, with "gantt_chart" and "metrics"
+            engine: Engine tag of the result
+        """
+        metrics = result.get("metrics", {})
+        rest = {key: value for key, value in result.items() if key != "gantt_chart"}
+        columns = ("workload_digest", "algorithm", "params", "engine", "algorithm_name",
+                   "created_at") + METRIC_COLUMNS + ("gantt", "result")
+        values = (digest, algorithm, json.dumps(params, sort_keys=True), engine,
+                  result.get("algorithm"), time.time(),
+                  *(metrics.get(column) for column in METRIC_COLUMNS),
+                  _pack(result.get("gantt_chart", [])), _pack(rest))
+        with self.connection:
+            self.connection.execute(
+                f"INSERT OR REPLACE INTO results ({', '.join(columns)})"
+                f" VALUES ({', '.join('?' * len(columns))})",
+                values
+            )
+    
+    def query(self, algorithm: Optional[str] = None, digest: Optional[str] = None,
+              engine: Optional[str] = None, order_by: str = "avg_waiting_time",
+              limit: Optional[int] = None) -> List[Dict]:
+        """
+        Metrics of stored runs, without unpacking their results
+        
+        Args:
+            algorithm: Only runs of this algorithm
+            digest: Only runs of this workload
+            engine: Only runs from this engine
+            order_by: Metric column to sort by (ascending)
+            limit: Maximum number of rows
+        
+        Returns:
+            One dict per run: workload_digest, algorithm, params, engine,
+            algorithm_name, created_at and the metric columns
+        """
+        if order_by not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown metric: {order_by}")
+        filters = {"algorithm": algorithm, "workload_digest": digest, "engine": engine}
+        conditions = [f"{column} = ?" for column, value in filters.items() if value is not None]
+        columns = ("workload_digest", "algorithm", "params", "engine", "algorithm_name",
+                   "created_at") + METRIC_COLUMNS
+        sql = f"SELECT {', '.join(columns)} FROM results"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {order_by}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        rows = self.connection.execute(sql, [value for value in filters.values() if value is not None])
+        results = []
+        for row in rows:
+            record = dict(zip(columns, row))
+            record["params"] = json.loads(record["params"])
+            results.append(record)
+        return results
+    
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+    
+    def close(self) -> None:
+        self.connection.close()
+    
+    def __enter__(self) -> 'ResultStore':
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,48 +1,137 @@
 """Simulation Service"""
-from typing import List, Dict
+import json
+from typing import List, Dict, Optional
 from models.process import Process
 from algorithms.scheduler import SchedulingSimulator
+from .result_cache import ResultCache, result_key, workload_digest
+from .result_store import ResultStore
 
 
 class SimulationService:
     """Handles simulation operations"""
     
-    def __init__(self, processes: List[Process]):
+    def __init__(self, processes: List[Process], n_cpus: int = 1, per_core_queues: bool = False,
+                 cache: Optional[ResultCache] = None, store: Optional[ResultStore] = None):
+        """
+        Args:
+            processes: Processes to simulate; not to be modified while the service is used
+            n_cpus: Number of simulated CPU cores
+            per_core_queues: Give each core its own ready queue instead of a shared one
+            cache: Result cache to consult and fill, typically shared across services
+            store: Persistent result store, consulted after the cache
+        """
+        self.processes = processes
+        self.simulator = SchedulingSimulator(processes, n_cpus, per_core_queues)
+        self.cache = cache
+        self.store = store
+        self._digest: Optional[str] = None
+        # Latest result per (method, arguments), the starting point for resume()
+        self._previous: Dict[tuple, dict] = {}
+    
+    def update(self, processes: List[Process]) -> None:
+        """
+        Switch to a changed process set
+        
+        Later runs resume from this service's earlier results where the
+        change allows (see SchedulingSimulator.resume): the schedule before
+        the first affected arrival is reused and only the rest is simulated.
+        
+        Args:
+            processes: The new process set
+        """
         self.processes = processes
-        self.simulator = SchedulingSimulator(processes)
+        self.simulator = SchedulingSimulator(processes, **self.simulator.options)
+        self._digest = None
     
-    def run_all_algorithms(self, time_quantum: int = 3) -> Dict[str, dict]:
+    def run_all_algorithms(self, time_quantum: int = 3, parallel: bool = False) -> Dict[str, dict]:
         """
         Run all scheduling algorithms
         
         Args:
             time_quantum: Time quantum for Round Robin algorithm
+            parallel: Run the algorithms in worker processes
             
         Returns:
             Dictionary with results for each algorithm
         """
-        return self.simulator.run_all(time_quantum)
+        return self._run(self.simulator.all_runs(time_quantum), parallel)
     
-    def run_single_algorithm(self, algorithm: str, time_quantum: int = 3) -> dict:
+    def run_single_algorithm(self, algorithm: str, time_quantum: int = 3,
+                             aging_interval: int = 5) -> dict:
         """
         Run a single scheduling algorithm
         
         Args:
-            algorithm: Algorithm name ('fcfs', 'sjf', 'round_robin', 'priority')
+            algorithm: Algorithm name ('fcfs', 'sjf', 'round_robin', 'priority', 'srtf',
+                       'priority_aging', 'mlfq')
             time_quantum: Time quantum for Round Robin
+            aging_interval: Aging interval for Priority with Aging
             
         Returns:
             Results dictionary for the algorithm
         """
-        if algorithm == 'fcfs':
-            return self.simulator.fcfs()
-        elif algorithm == 'sjf':
-            return self.simulator.sjf()
-        elif algorithm == 'round_robin':
-            return self.simulator.round_robin(time_quantum)
-        elif algorithm == 'priority':
-            return self.simulator.priority_scheduling()
-        else:
+        runs = {
+            'fcfs': ('fcfs', {}),
+            'sjf': ('sjf', {}),
+            'round_robin': ('round_robin', {'time_quantum': time_quantum}),
+            'priority': ('priority_scheduling', {}),
+            'srtf': ('srtf', {}),
+            'priority_aging': ('priority_aging', {'aging_interval': aging_interval}),
+            'mlfq': ('mlfq', {})
+        }
+        if algorithm not in runs:
             raise ValueError(f"Unknown algorithm: {algorithm}")
+        return self._run({algorithm: runs[algorithm]})[algorithm]
+    
+    def _run(self, runs: Dict[str, tuple], parallel: bool = False) -> Dict[str, dict]:
+        """
+        Run simulator methods, answering what it can from the cache and store
+        
+        Runs with an earlier result in this service are resumed from it;
+        the others are simulated from scratch.
+        
+        Args:
+            runs: Result key -> (simulator method name, keyword arguments)
+            parallel: Run the from-scratch ones in worker processes
+        
+        Returns:
+            Result key -> result dict, in the order of runs
+        """
+        if self._digest is None and (self.cache is not None or self.store is not None):
+            self._digest = workload_digest(self.processes)
+        results = {name: self._lookup(method, kwargs) for name, (method, kwargs) in runs.items()}
+        missing = {name: runs[name] for name, result in results.items() if result is None}
+        fresh = {name: run for name, run in missing.items() if _run_key(*run) not in self._previous}
+        computed = self.simulator.run_many(fresh, parallel) if fresh else {}
+        for name, (method, kwargs) in missing.items():
+            if name not in fresh:
+                computed[name] = self.simulator.resume(method, self._previous[_run_key(method, kwargs)], **kwargs)
+        
+        for name, result in computed.items():
+            method, kwargs = runs[name]
+            params = {**kwargs, **self.simulator.options}
+            if self.cache is not None:
+                self.cache.put(result_key(self._digest, method, params), result)
+            if self.store is not None:
+                self.store.put(self._digest, method, params, result)
+            results[name] = result
+        for name, (method, kwargs) in runs.items():
+            self._previous[_run_key(method, kwargs)] = results[name]
+        return results
+    
+    def _lookup(self, method: str, kwargs: dict) -> Optional[dict]:
+        """Cached or stored result of a run; store hits are promoted into the cache"""
+        if self.cache is None and self.store is None:
+            return None
+        params = {**kwargs, **self.simulator.options}
+        key = result_key(self._digest, method, params)
+        result = self.cache.get(key) if self.cache is not None else None
+        if result is None and self.store is not None:
+            result = self.store.get(self._digest, method, params)
+            if result is not None and self.cache is not None:
+                self.cache.put(key, result)
+        return result
 
 
+def _run_key(method: str, kwargs: dict) -> tuple:
+    return method, json.dumps(kwargs, sort_keys=True)
@@ -0,0 +1,16 @@
+"""FCFS per-process result order"""
+from models.process import Process
+from algorithms.scheduler import SchedulingSimulator
+
+# Duplicate PIDs (P1, P2) and distinct PIDs sharing a sort key (A1, P1, Q1)
+ROWS = [("P2", 6, 2, 1), ("P1", 4, 3, 2), ("A1", 15, 1, 1), ("P2", 1, 4, 3),
+        ("Q1", 3, 2, 2), ("Q", 0, 2, 1), ("P1", 2, 1, 1)]
+
+
+def test_fcfs_lists_tied_pids_in_dispatch_order():
+    # Order produced by the original list-based FCFS: natural PID order, ties in dispatch order
+    result = SchedulingSimulator([Process(*row) for row in ROWS]).fcfs()
+    assert [(p["pid"], p["arrival_time"], p["finish_time"]) for p in result["processes"]] == [
+        ("P1", 2, 7), ("Q1", 3, 9), ("P1", 4, 12), ("A1", 15, 16),
+        ("P2", 1, 6), ("P2", 6, 14), ("Q", 0, 2)
+    ]
@@ -0,0 +1,58 @@
+"""GanttTrace behaves like the list of segment dicts it replaces"""
+from models.gantt_trace import GanttTrace
+from models.process import Process
+from algorithms.scheduler import SchedulingSimulator
+
+SEGMENTS = [
+    {"pid": "P1", "start": 0, "end": 2},
+    {"pid": "IDLE", "start": 2, "end": 3},
+    {"pid": "P2", "start": 3, "end": 7, "dispatches": 2},
+    {"pid": "CYCLE", "start": 7, "end": 19, "cycle": ["P1", "P3"], "quantum": 2, "rounds": 3},
+    {"pid": "P3", "start": 19, "end": 20}
+]
+
+
+def test_slicing_matches_list_slicing():
+    trace = GanttTrace.from_segments(SEGMENTS)
+    for index in (slice(None), slice(1, 4), slice(2, None), slice(None, None, 2), slice(None, None, -1)):
+        assert isinstance(trace[index], GanttTrace)
+        assert trace[index].to_list() == SEGMENTS[index]
+    assert trace[-1] == SEGMENTS[-1]
+    assert trace == SEGMENTS
+
+
+def test_extend_matches_list_concatenation():
+    for cut in range(len(SEGMENTS) + 1):
+        trace = GanttTrace.from_segments(SEGMENTS[:cut])
+        trace.extend(GanttTrace.from_segments(SEGMENTS[cut:]))
+        assert trace.to_list() == SEGMENTS
+    assert trace.dispatches == 1 + 2 + 3 * 2 + 1
+
+
+def test_coalesce_merges_only_the_same_job():
+    trace = GanttTrace(coalesce=True)
+    code = trace.intern("P1")
+    trace.add(code, 0, 2, job=0)
+    trace.add(code, 2, 4, job=0)
+    # Another job with the same PID, then segments without a job, start new segments
+    trace.add(code, 4, 5, job=1)
+    trace.append({"pid": "P1", "start": 5, "end": 6})
+    trace.append({"pid": "P1", "start": 6, "end": 8, "dispatches": 3})
+    assert trace.to_list() == [
+        {"pid": "P1", "start": 0, "end": 4, "dispatches": 2},
+        {"pid": "P1", "start": 4, "end": 5},
+        {"pid": "P1", "start": 5, "end": 6},
+        {"pid": "P1", "start": 6, "end": 8, "dispatches": 3}
+    ]
+    assert trace.dispatches == 7
+
+
+def test_back_to_back_jobs_sharing_a_pid_stay_separate():
+    sim = SchedulingSimulator([Process("P1", 0, 2, 1), Process("P1", 1, 6, 1)])
+    expected = [
+        {"pid": "P1", "start": 0, "end": 2},
+        {"pid": "P1", "start": 2, "end": 8, "dispatches": 3}
+    ]
+    assert sim.round_robin(2)["gantt_chart"] == expected
+    assert sim.round_robin(2, fast_forward=True)["gantt_chart"] == expected
+    assert sim.fcfs()["gantt_chart"] == [{"pid": "P1", "start": 0, "end": 2}, {"pid": "P1", "start": 2, "end": 8}]
@@ -0,0 +1,78 @@
+"""Schedules produced by the simulation kernel's preemptive and multi-CPU paths"""
+from models.process import Process
+from algorithms.round_robin import RoundRobinAlgorithm, expand_gantt
+from algorithms.scheduler import SchedulingSimulator
+
+
+def simulator(rows, **options):
+    return SchedulingSimulator([Process(*row) for row in rows], **options)
+
+
+def segments(gantt):
+    return [(segment["pid"], segment["start"], segment["end"]) for segment in gantt]
+
+
+def test_srtf_preempts_for_shorter_arrival():
+    result = simulator([("P1", 0, 8, 3), ("P2", 1, 4, 1), ("P3", 2, 9, 4), ("P4", 3, 5, 2)]).srtf()
+    assert segments(result["gantt_chart"]) == [
+        ("P1", 0, 1), ("P2", 1, 5), ("P4", 5, 10), ("P1", 10, 17), ("P3", 17, 26)
+    ]
+    assert result["metrics"]["avg_waiting_time"] == 6.5
+
+
+def test_mlfq_demotes_after_quantum():
+    result = simulator([("P1", 0, 6, 1), ("P2", 0, 6, 1)]).mlfq()
+    assert segments(result["gantt_chart"]) == [
+        ("P1", 0, 4), ("P2", 4, 8), ("P1", 8, 10), ("P2", 10, 12)
+    ]
+
+
+def test_round_robin_fast_forward_expands_to_step_by_step_quanta():
+    # A lone queued job is fast-forwarded too, and must still expand to one segment per quantum
+    sim = simulator([("P1", 0, 3, 1), ("P2", 2, 10, 1), ("P3", 20, 5, 1)], coalesce=False)
+    step = sim.round_robin(2)
+    fast = sim.round_robin(2, fast_forward=True)
+    assert list(expand_gantt(fast["gantt_chart"])) == list(step["gantt_chart"])
+    assert fast["gantt_chart"].dispatches == step["gantt_chart"].dispatches
+
+
+def test_priority_aging_preempts_once_waiting_job_outranks():
+    result = simulator([("P1", 0, 10, 5), ("P2", 1, 3, 1), ("P3", 2, 3, 5)]).priority_aging(2)
+    assert segments(result["gantt_chart"]) == [
+        ("P1", 0, 1), ("P2", 1, 4), ("P1", 4, 8), ("P3", 8, 11), ("P1", 11, 16)
+    ]
+
+
+def test_priority_aging_smp_keeps_job_when_other_core_took_the_waiting_one():
+    # The aging tick timed for P55 fires at 18 after P30 was dispatched on core 1;
+    # nothing waiting outranks P55 then, so it must keep its CPU
+    result = simulator([("P19", 14, 8, 6), ("P10", 10, 8, 3), ("P30", 9, 8, 4),
+                        ("P40", 4, 2, 4), ("P55", 5, 11, 4), ("P11", 10, 3, 1)],
+                       n_cpus=2).priority_aging(2)
+    core0, core1 = (segments(core["gantt_chart"]) for core in result["cores"])
+    assert ("P55", 14, 20) in core0
+    assert ("P19", 20, 28) in core0
+    assert ("P30", 18, 24) in core1
+
+
+def test_fcfs_smp_dispatches_to_first_free_core():
+    result = simulator([("P1", 0, 4, 1), ("P2", 0, 2, 1), ("P3", 1, 3, 1), ("P4", 2, 1, 1)],
+                       n_cpus=2).fcfs()
+    assert [segments(core["gantt_chart"]) for core in result["cores"]] == [
+        [("P1", 0, 4), ("P4", 4, 5)],
+        [("P2", 0, 2), ("P3", 2, 5)]
+    ]
+    assert {p["pid"]: p["finish_time"] for p in result["processes"]} == {"P1": 4, "P2": 2, "P3": 5, "P4": 5}
+
+
+def test_stream_matches_execute_with_duplicate_pids():
+    # Job 1 finishing on core 1 must not flush job 0's held-back P2 segment on core 0
+    rows = [("P2", 0, 6, 1), ("P2", 3, 2, 1), ("P1", 0, 1, 1)]
+    algorithm = RoundRobinAlgorithm()
+    for n_cpus in (1, 2):
+        executed = algorithm.execute([Process(*row) for row in rows], n_cpus=n_cpus, time_quantum=2)
+        streamed = [record for kind, record in algorithm.iter_schedule([Process(*row) for row in rows],
+                                                                       n_cpus=n_cpus, time_quantum=2)
+                    if kind == "segment"]
+        by_start = lambda segment: (segment["start"], segment.get("core", 0))
+        assert sorted(streamed, key=by_start) == list(executed["gantt_chart"])
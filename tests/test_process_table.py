@@ -0,0 +1,55 @@
+"""ProcessTable columns, reset and reuse by the simulator"""
+from array import array
+from models.process import Process
+from models.process_table import ProcessTable
+from algorithms.scheduler import SchedulingSimulator
+
+ROWS = [("P10", 3, 4, 2), ("P2", 0, 5, 1), ("P10", 1, 2, 3), ("A", 2, 1, 1)]
+
+
+def table():
+    return ProcessTable.from_processes([Process(*row) for row in ROWS])
+
+
+def test_columns_intern_pids_and_rank_them_naturally():
+    workload = table()
+    assert workload.names == ["P10", "P2", "A"]
+    assert workload.pid_index.tolist() == [0, 1, 0, 2]
+    assert workload.pids == [row[0] for row in ROWS]
+    assert workload.name_rank.tolist() == [1, 0, 2]
+    assert workload.remaining.tolist() == workload.burst.tolist() == [4, 5, 2, 1]
+
+
+def test_reset_clears_the_outputs_of_a_run():
+    workload = table()
+    workload.store([0, 1, 0, 0], [9, 5, 7, 8])
+    assert workload.turnaround.tolist() == [6, 5, 6, 6]
+    assert workload.waiting.tolist() == [2, 0, 4, 5]
+    workload.reset()
+    assert workload.remaining.tolist() == [4, 5, 2, 1]
+    assert workload.finish.tolist() == workload.turnaround.tolist() == workload.waiting.tolist() == [0] * 4
+
+
+def test_from_columns_shares_inputs_and_allocates_outputs():
+    source = table()
+    source.store([0] * 4, [9, 5, 7, 8])
+    view = memoryview(source.arrival)
+    adopted = ProcessTable.from_columns(source.names, source.pid_index, view, source.burst,
+                                        source.priority, source.name_rank)
+    assert adopted.arrival is view
+    assert adopted.name_rank is source.name_rank
+    assert adopted.pids == source.pids
+    assert adopted.finish.tolist() == [0] * 4
+    assert adopted.remaining.tolist() == source.burst.tolist()
+    assert isinstance(adopted.remaining, array)
+
+
+def test_simulator_leaves_a_passed_table_untouched():
+    workload = table()
+    listed = SchedulingSimulator([Process(*row) for row in ROWS]).run_all(2)
+    tabled = SchedulingSimulator(workload).run_all(2)
+    for name, result in listed.items():
+        assert list(result["processes"]) == list(tabled[name]["processes"])
+        assert result["gantt_chart"] == tabled[name]["gantt_chart"]
+    assert workload.finish.tolist() == [0] * 4
+    assert workload.remaining.tolist() == [4, 5, 2, 1]
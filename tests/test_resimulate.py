@@ -0,0 +1,66 @@
+"""Resuming from a checkpoint after a workload edit matches a full re-run"""
+import pytest
+from models.process import Process
+from algorithms.scheduler import SchedulingSimulator
+from services.simulation_service import SimulationService
+
+# Two busy periods; the second starts after the CPUs went idle at 12
+ROWS = [("P1", 0, 5, 3), ("P2", 1, 3, 1), ("P3", 2, 4, 2),
+        ("P4", 20, 6, 2), ("P5", 22, 2, 1), ("P6", 25, 4, 3)]
+
+EDITS = {
+    "add": ROWS + [("P7", 23, 3, 2)],
+    "remove": ROWS[:4] + ROWS[5:],
+    "change": ROWS[:5] + [("P6", 24, 7, 3)],
+}
+
+METHODS = [
+    ("fcfs", {}), ("sjf", {}), ("round_robin", {"time_quantum": 2}),
+    ("priority_scheduling", {}), ("srtf", {}), ("priority_aging", {"aging_interval": 3}),
+    ("mlfq", {"quanta": (2, 4)})
+]
+
+
+def summary(result):
+    cores = [core["gantt_chart"].to_list() for core in result.get("cores", ())]
+    return result["gantt_chart"].to_list(), list(result["processes"]), result["metrics"], cores
+
+
+@pytest.mark.parametrize("n_cpus", [1, 2])
+@pytest.mark.parametrize("edit", sorted(EDITS))
+@pytest.mark.parametrize("method,kwargs", METHODS)
+def test_resume_matches_a_full_run(monkeypatch, method, kwargs, edit, n_cpus):
+    original = SchedulingSimulator([Process(*row) for row in ROWS], n_cpus)
+    previous = getattr(original, method)(**kwargs)
+    simulator = SchedulingSimulator([Process(*row) for row in EDITS[edit]], n_cpus)
+    fresh = getattr(simulator, method)(**kwargs)
+    
+    algorithm = getattr(simulator, SchedulingSimulator.ALGORITHMS[method])
+    fallbacks = []
+    monkeypatch.setattr(algorithm, "execute", lambda *args, **options: fallbacks.append(args))
+    simulator.resume(method, previous, **kwargs)
+    # Resumed from the idle point, not re-run from scratch; single-CPU FCFS
+    # always takes its closed form
+    assert fallbacks == [] or (method == "fcfs" and n_cpus == 1)
+    monkeypatch.undo()
+    assert summary(simulator.resume(method, previous, **kwargs)) == summary(fresh)
+
+
+def test_service_update_resumes_from_its_previous_runs():
+    service = SimulationService([Process(*row) for row in ROWS])
+    service.run_all_algorithms(2)
+    edited = [Process(*row) for row in EDITS["change"]]
+    service.update(edited)
+    expected = SchedulingSimulator(edited).run_all(2)
+    results = service.run_all_algorithms(2)
+    assert set(results) == set(expected)
+    for name, result in results.items():
+        assert summary(result) == summary(expected[name])
+
+
+def test_edit_before_the_first_idle_point_runs_from_scratch():
+    previous = SchedulingSimulator([Process(*row) for row in ROWS]).round_robin(2)
+    edited = [Process("P1", 0, 9, 3)] + [Process(*row) for row in ROWS[1:]]
+    simulator = SchedulingSimulator(edited)
+    assert summary(simulator.resume("round_robin", previous, time_quantum=2)) == \
+        summary(simulator.round_robin(2))
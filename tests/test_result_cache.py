@@ -0,0 +1,61 @@
+"""ResultCache hits, misses, keys and disk tier"""
+import os
+from models.process import Process
+from services import result_cache
+from services.result_cache import ResultCache, result_key, workload_digest
+from services.simulation_service import SimulationService
+
+ROWS = [("P1", 0, 5, 2), ("P2", 1, 3, 1), ("P3", 2, 8, 3)]
+
+
+def test_memory_hits_misses_and_lru_eviction():
+    cache = ResultCache(max_entries=2)
+    assert cache.get("a") is None
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2})
+    assert cache.get("a") == {"n": 1}
+    cache.put("c", {"n": 3})
+    # "b" was the least recently used
+    assert cache.get("b") is None
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 2, "entries": 2}
+
+
+def test_key_changes_with_params_workload_and_engine_version(monkeypatch):
+    digest = workload_digest([Process(*row) for row in ROWS])
+    key = result_key(digest, "round_robin", {"time_quantum": 3, "n_cpus": 1})
+    assert key == result_key(digest, "round_robin", {"n_cpus": 1, "time_quantum": 3})
+    assert key != result_key(digest, "round_robin", {"time_quantum": 4, "n_cpus": 1})
+    assert key != result_key(digest, "fcfs", {"time_quantum": 3, "n_cpus": 1})
+    other = workload_digest([Process(*row) for row in ROWS[:2]])
+    assert key != result_key(other, "round_robin", {"time_quantum": 3, "n_cpus": 1})
+    monkeypatch.setattr(result_cache, "ENGINE_VERSION", result_cache.ENGINE_VERSION + 1)
+    assert key != result_key(digest, "round_robin", {"time_quantum": 3, "n_cpus": 1})
+
+
+def test_service_reuses_cached_results():
+    cache = ResultCache()
+    first = SimulationService([Process(*row) for row in ROWS], cache=cache).run_single_algorithm("round_robin", 2)
+    again = SimulationService([Process(*row) for row in ROWS], cache=cache).run_single_algorithm("round_robin", 2)
+    other = SimulationService([Process(*row) for row in ROWS], cache=cache).run_single_algorithm("round_robin", 3)
+    assert again is first
+    assert other is not first
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_disk_tier_promotes_and_prunes_least_recently_used(tmp_path):
+    directory = str(tmp_path)
+    cache = ResultCache(max_entries=1, directory=directory)
+    for name in "abc":
+        cache.put(name, {"name": name, "pad": "x" * 1000})
+    # Evicted from memory but still on disk
+    assert cache.get("a") == {"name": "a", "pad": "x" * 1000}
+    assert cache.disk_hits == 1
+    
+    size = os.path.getsize(os.path.join(directory, "a.pickle"))
+    for age, name in enumerate("cba"):
+        os.utime(os.path.join(directory, name + ".pickle"), (1000 - age, 1000 - age))
+    small = ResultCache(max_entries=1, directory=directory, max_disk_bytes=3 * size)
+    assert small.get("b") is not None
+    small.put("d", {"name": "d", "pad": "x" * 1000})
+    # "a" was used longest ago; "b" was just read
+    assert sorted(os.listdir(directory)) == ["b.pickle", "c.pickle", "d.pickle"]
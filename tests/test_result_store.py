@@ -0,0 +1,78 @@
+"""ResultStore round trips and metric queries"""
+import pickle
+import zlib
+import pytest
+from models.gantt_trace import GanttTrace
+from models.process import Process
+from algorithms.scheduler import SchedulingSimulator
+from services.result_store import ResultStore
+
+ROWS = [("P1", 0, 9, 2), ("P2", 1, 7, 1), ("P3", 2, 3, 3), ("P4", 30, 2, 1)]
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ResultStore(str(tmp_path / "results.db")) as store:
+        yield store
+
+
+def test_results_round_trip(store):
+    single = SchedulingSimulator([Process(*row) for row in ROWS])
+    runs = {
+        "fcfs": single.fcfs(),
+        # Fast-forward leaves a "CYCLE" record and coalesced segments in the chart
+        "round_robin": single.round_robin(1, fast_forward=True),
+        "srtf": SchedulingSimulator([Process(*row) for row in ROWS], n_cpus=2).srtf()
+    }
+    for method, result in runs.items():
+        store.put("digest", method, {}, result)
+    for method, result in runs.items():
+        stored = store.get("digest", method, {})
+        assert isinstance(stored["gantt_chart"], GanttTrace)
+        assert stored["gantt_chart"].to_list() == result["gantt_chart"].to_list()
+        assert stored["gantt_chart"].dispatches == result["gantt_chart"].dispatches
+        assert stored["processes"] == result["processes"]
+        assert stored["metrics"] == result["metrics"]
+        assert stored["algorithm"] == result["algorithm"]
+    cores = store.get("digest", "srtf", {})["cores"]
+    assert [core["gantt_chart"] for core in cores] == [core["gantt_chart"] for core in runs["srtf"]["cores"]]
+    assert (store.hits, store.misses) == (4, 0)
+
+
+def test_lookup_is_keyed_on_params_and_engine(store):
+    result = SchedulingSimulator([Process(*row) for row in ROWS]).round_robin(2)
+    store.put("digest", "round_robin", {"time_quantum": 2}, result)
+    assert store.get("digest", "round_robin", {"time_quantum": 2}) is not None
+    assert store.get("digest", "round_robin", {"time_quantum": 3}) is None
+    assert store.get("digest", "round_robin", {"time_quantum": 2}, engine="other") is None
+    assert store.get("other", "round_robin", {"time_quantum": 2}) is None
+    assert (store.hits, store.misses) == (1, 3)
+
+
+def test_query_filters_and_orders_by_metric(store):
+    simulator = SchedulingSimulator([Process(*row) for row in ROWS])
+    for quantum in (1, 2, 4, 8):
+        store.put("a", "round_robin", {"time_quantum": quantum}, simulator.round_robin(quantum))
+    store.put("a", "fcfs", {}, simulator.fcfs())
+    store.put("b", "fcfs", {}, simulator.fcfs())
+    
+    rows = store.query(algorithm="round_robin", order_by="avg_turnaround_time")
+    assert [row["params"]["time_quantum"] for row in rows] == sorted(
+        (1, 2, 4, 8), key=lambda quantum: simulator.round_robin(quantum)["metrics"]["avg_turnaround_time"])
+    assert [row["avg_turnaround_time"] for row in rows] == sorted(row["avg_turnaround_time"] for row in rows)
+    assert len(store.query(algorithm="round_robin", limit=2)) == 2
+    assert [row["workload_digest"] for row in store.query(algorithm="fcfs", digest="b")] == ["b"]
+    assert len(store) == 6
+    with pytest.raises(ValueError):
+        store.query(order_by="finish_time")
+
+
+def test_pickled_rows_are_misses_and_get_replaced(store):
+    result = SchedulingSimulator([Process(*row) for row in ROWS]).fcfs()
+    store.put("digest", "fcfs", {}, result)
+    blob = zlib.compress(pickle.dumps({"metrics": {}}))
+    with store.connection:
+        store.connection.execute("UPDATE results SET result = ?, gantt = ?", (blob, blob))
+    assert store.get("digest", "fcfs", {}) is None
+    store.put("digest", "fcfs", {}, result)
+    assert store.get("digest", "fcfs", {})["metrics"] == result["metrics"]
@@ -0,0 +1,56 @@
+"""Binary workload format round trips and header checks"""
+import pytest
+from models.process import Process
+from models.process_table import ProcessTable
+from services.file_service import FileService
+from utils import workload_binary
+
+ROWS = [("P10", 3, 4, 2), ("P2", 0, 5, 1), ("P10", 1, 2, 3), ("进程", -7, 2 ** 40, 0)]
+
+
+def columns(table):
+    return table.pids, list(table.arrival), list(table.burst), list(table.priority)
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "workload.bin")
+    FileService.save_binary(path, [Process(*row) for row in ROWS])
+    table = FileService.load_binary(path)
+    assert columns(table) == tuple(map(list, zip(*ROWS)))
+    assert table.names == ["P10", "P2", "进程"]
+    assert isinstance(table.arrival, memoryview)
+    # Outputs are the table's own, ready for a run
+    assert list(table.remaining) == list(table.burst)
+    assert list(table.finish) == [0] * len(ROWS)
+
+
+def test_table_and_empty_round_trips():
+    table = ProcessTable.from_processes([Process(*row) for row in ROWS])
+    assert columns(workload_binary.from_buffer(workload_binary.to_bytes(table))) == columns(table)
+    empty = workload_binary.from_buffer(workload_binary.to_bytes([]))
+    assert len(empty) == 0 and empty.names == []
+
+
+@pytest.mark.parametrize("damage", [
+    lambda data: b"NOTAWKLD" + data[8:],
+    lambda data: data[:10],
+    lambda data: data[:-8],
+    lambda data: data + b"\0" * 8,
+    # Row count in the header larger than the columns
+    lambda data: data[:8] + (5).to_bytes(8, "little") + data[16:],
+    # Name count that does not match the string table
+    lambda data: data[:16] + (2).to_bytes(8, "little") + data[24:],
+])
+def test_damaged_files_are_rejected(tmp_path, damage):
+    data = damage(workload_binary.to_bytes([Process(*row) for row in ROWS]))
+    with pytest.raises(ValueError):
+        workload_binary.from_buffer(data)
+    path = tmp_path / "damaged.bin"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        FileService.load_binary(str(path))
+
+
+def test_nul_in_pid_is_refused():
+    with pytest.raises(ValueError):
+        workload_binary.to_bytes([Process("P\0", 0, 1, 1)])
@@ -0,0 +1,83 @@
+"""Bulk workload parser parity with the original line-by-line parser"""
+import pytest
+from services.file_service import FileService
+from utils.workload_parser import read_columns
+
+LINES = [
+    "# pid,arrival,burst,priority",
+    "P1,0,5,2",
+    "",
+    "   ",
+    " P2 , 1 , 3 , 1 ",
+    "\tP3,2,8,3\t",
+    "P4,3,6",
+    "P5,4,2,1,extra,fields",
+    "   # indented comment,1,2,3",
+    "P10,-1,+4,0",
+    "P6,5,7,2,",
+    "P 7,6,1,1",
+    "P8,7,2,1\x0cP9,8,3,1",
+    "P11,9,1,1 # trailing note",
+    "P12,10,2,1",
+]
+
+
+def reference_parse(path):
+    """The line-by-line parser the bulk parser replaced"""
+    rows = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = [p.strip() for p in line.split(',')]
+            if len(parts) >= 4:
+                rows.append((parts[0], int(parts[1]), int(parts[2]), int(parts[3])))
+    return rows
+
+
+def parse(path, block_size):
+    pids, arrival, burst, priority = read_columns(str(path), block_size)
+    return list(zip(pids, arrival, burst, priority))
+
+
+def write(tmp_path, lines, newline="\n"):
+    path = tmp_path / "workload.txt"
+    path.write_text(newline.join(lines), newline="")
+    return path
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_valid_and_skipped_lines_match_the_original_parser(tmp_path, newline):
+    # Lines the original parser rejected with a ValueError are checked separately
+    lines = [line for line in LINES if "\x0c" not in line and "note" not in line]
+    path = write(tmp_path, lines, newline)
+    expected = reference_parse(path)
+    assert [row[0] for row in expected] == ["P1", "P2", "P3", "P5", "P10", "P6", "P 7", "P12"]
+    for block_size in (1, 7, 64, 1 << 22):
+        assert parse(path, block_size) == expected
+    assert [(p.pid, p.arrival_time, p.burst_time, p.priority)
+            for p in FileService.load_from_file(str(path))] == expected
+    assert FileService.load_table(str(path)).pids == [row[0] for row in expected]
+
+
+@pytest.mark.parametrize("bad", ["P8,7,2,1\x0cP9,8,3,1", "P11,9,1,1 # trailing note", "P1,x,2,1",
+                                 "P1,1.5,2,1", "P1,,2,1", ",,,", "P1, ,2,1", "P1,-,2,1",
+                                 "P1,- 1,2,1"])
+def test_malformed_lines_are_rejected_like_the_original_parser(tmp_path, bad):
+    path = write(tmp_path, ["P1,0,5,2", bad, "P2,1,3,1"])
+    with pytest.raises(ValueError):
+        reference_parse(path)
+    for block_size in (5, 1 << 22):
+        with pytest.raises(ValueError):
+            parse(path, block_size)
+    with pytest.raises(ValueError):
+        FileService.load_table(str(path))
+
+
+def test_out_of_range_values_are_rejected_not_clamped(tmp_path):
+    path = write(tmp_path, ["P1,0,5,2", "P2,99999999999999999999,3,1"])
+    with pytest.raises(OverflowError):
+        parse(path, 1 << 22)
+    path = write(tmp_path, ["P1,0,9223372036854775807,-9223372036854775808"])
+    assert parse(path, 1 << 22) == [("P1", 0, 2 ** 63 - 1, -2 ** 63)]
@@ -16,6 +16,7 @@ from matplotlib.backends.backend_pdf import PdfPages
 
 from services.process_service import ProcessService
 from services.simulation_service import SimulationService
+from services.result_cache import ResultCache
 from services.file_service import FileService
 from ui.components import ModernCard
 from ui.header import HeaderWidget
@@ -37,6 +38,7 @@ class CPUSchedulerApp(QMainWindow):
         self.process_service = ProcessService()
         self.file_service = FileService()
         self.simulation_service = None
+        self.result_cache = ResultCache()
         
         # State
         self.results = None
@@ -216,8 +218,7 @@ class CPUSchedulerApp(QMainWindow):
             ('P4', 3, 5, 2)
         ]
         
-        for pid, arrival, burst, priority in samples:
-            self.process_service.add_process(pid, arrival, burst, priority)
+        self.process_service.add_many(samples)
         
         self.input_tab.refresh_process_table()
         self.show_msg("info", "Success", "Sample loaded!")
@@ -237,15 +238,14 @@ class CPUSchedulerApp(QMainWindow):
         if file_name:
             try:
                 self.clear_processes()
-                processes = self.file_service.load_from_file(file_name)
-                
-                for proc in processes:
-                    self.process_service.add_process(
-                        proc.pid, proc.arrival_time, proc.burst_time, proc.priority
-                    )
+                table = self.file_service.load_table(file_name)
+                added = self.process_service.load_table(table)
                 
                 self.input_tab.refresh_process_table()
-                self.show_msg("info", "Success", f"Loaded {len(processes)} processes!")
+                message = f"Loaded {added} processes!"
+                if added < len(table):
+                    message += f"\nSkipped {len(table) - added} duplicate PIDs."
+                self.show_msg("info", "Success", message)
             
             except Exception as e:
                 self.show_msg("error", "Error", f"Failed to load file:\n{str(e)}")
@@ -264,7 +264,11 @@ class CPUSchedulerApp(QMainWindow):
         try:
             # Create simulation service
             processes = self.process_service.get_all()
-            self.simulation_service = SimulationService(processes)
+            if self.simulation_service is None:
+                self.simulation_service = SimulationService(processes, cache=self.result_cache)
+            else:
+                # Resumes from the previous results instead of starting over
+                self.simulation_service.update(processes)
             
             # Run simulation
             self.results = self.simulation_service.run_all_algorithms(tq)
@@ -4,7 +4,8 @@
 ALGO_COLORS = {
     'FCFS': '#2563eb',
     'SJF': '#10b981',
-    'Priority Scheduling': '#ef4444'
+    'Priority Scheduling': '#ef4444',
+    'SRTF': '#f59e0b'
 }
 
 # Default Settings
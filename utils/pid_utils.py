@@ -1,6 +1,9 @@
 """Process ID utility functions"""
 import re
-from typing import Tuple
+from array import array
+from typing import Sequence, Tuple
+
+_DIGITS = re.compile(r'\d+')
 
 
 def pid_key(pid: str) -> Tuple[int, int]:
@@ -10,10 +13,33 @@ def pid_key(pid: str) -> Tuple[int, int]:
     - (0, int_value) for numeric PIDs (sorted first, by number)
     - (1, pid_string) for non-numeric PIDs (sorted after, alphabetically)
     """
-    m = re.search(r'\d+', pid)
+    m = _DIGITS.search(pid)
     if m:
         return (0, int(m.group()))  # Numeric PIDs come first
     else:
         return (1, pid)  # Non-numeric PIDs come after, sorted alphabetically
 
 
+def natural_ranks(pids: Sequence[str]) -> array:
+    """
+    Dense rank of every PID in pid_key order, with one pid_key call per PID
+    
+    PIDs with equal keys share a rank, so a stable sort by rank orders rows
+    exactly like a stable sort by pid_key.
+    
+    Args:
+        pids: Distinct PID strings, e.g. ProcessTable.names
+    
+    Returns:
+        int64 array of ranks, parallel to pids
+    """
+    keys = [pid_key(pid) for pid in pids]
+    ranks = array('q', bytes(8 * len(keys)))
+    rank = -1
+    previous = None
+    for position in sorted(range(len(keys)), key=keys.__getitem__):
+        if keys[position] != previous:
+            rank += 1
+            previous = keys[position]
+        ranks[position] = rank
+    return ranks
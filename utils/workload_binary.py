@@ -0,0 +1,110 @@
+"""Binary workload format with memory-mapped loading"""
+import mmap
+import struct
+import sys
+from array import array
+from typing import Tuple
+
+from models.process_table import ProcessTable, Workload
+
+# File layout (little-endian):
+#   header       magic, row count, name count, string table size
+#   string table the distinct PIDs as UTF-8, NUL-separated, padded to 8 bytes
+#   columns      pid_index, arrival, burst, priority as int64, one after another
+MAGIC = b"SCHEDWL1"
+HEADER = struct.Struct('<8sQQQ')
+COLUMNS = ("pid_index", "arrival", "burst", "priority")
+
+
+def _padded(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def to_bytes(workload: Workload) -> bytes:
+    """
+    Encode a workload in the binary format
+    
+    Args:
+        workload: Process list or ProcessTable
+    
+    Returns:
+        The encoded file contents
+    """
+    table = workload if isinstance(workload, ProcessTable) else ProcessTable.from_processes(workload)
+    if any('\0' in name for name in table.names):
+        raise ValueError("PIDs must not contain NUL characters")
+    strings = '\0'.join(table.names).encode('utf-8')
+    parts = [HEADER.pack(MAGIC, len(table), len(table.names), len(strings)),
+             strings.ljust(_padded(len(strings)), b'\0')]
+    for name in COLUMNS:
+        column = getattr(table, name)
+        if sys.byteorder != 'little':
+            column = array('q', column)
+            column.byteswap()
+        parts.append(column)
+    return b''.join(parts)
+
+
+def save_table(filepath: str, workload: Workload) -> None:
+    """
+    Write a workload in the binary format
+    
+    Args:
+        filepath: Path of the file to write
+        workload: Process list or ProcessTable
+    """
+    with open(filepath, 'wb') as f:
+        f.write(to_bytes(workload))
+
+
+def load_table(filepath: str) -> ProcessTable:
+    """
+    Memory-map a binary workload file as a ProcessTable
+    
+    The input columns are read-only views into the mapping, so rows are
+    paged in on demand rather than copied; the mapping stays open for as
+    long as the table references it.
+    
+    Args:
+        filepath: Path of the binary workload file
+    
+    Returns:
+        ProcessTable over the mapped columns
+    """
+    with open(filepath, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return from_buffer(mapped)
+
+
+def from_buffer(buffer) -> ProcessTable:
+    """
+    View an encoded workload (bytes, mmap, shared memory...) as a ProcessTable
+    
+    The input columns are memoryviews into the buffer, not copies.
+    """
+    view = memoryview(buffer)
+    if len(view) < HEADER.size:
+        raise ValueError("Truncated binary workload header")
+    magic, n_rows, n_names, string_size = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not a binary workload file")
+    offset = HEADER.size + _padded(string_size)
+    if len(view) != offset + 8 * n_rows * len(COLUMNS):
+        raise ValueError("Binary workload size does not match its header")
+    
+    names = str(view[HEADER.size:HEADER.size + string_size], 'utf-8').split('\0') if n_names else []
+    if len(names) != n_names:
+        raise ValueError("Corrupt PID string table")
+    return ProcessTable.from_columns(names, *_columns(view[offset:], n_rows))
+
+
+def _columns(view: memoryview, n_rows: int) -> Tuple:
+    """Split the column region into int64 columns, copying only on big-endian hosts"""
+    columns = []
+    for position in range(len(COLUMNS)):
+        column = view[8 * n_rows * position:8 * n_rows * (position + 1)].cast('q')
+        if sys.byteorder != 'little':
+            column = array('q', column)
+            column.byteswap()
+        columns.append(column)
+    return tuple(columns)
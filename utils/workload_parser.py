@@ -0,0 +1,126 @@
+"""Bulk parser for comma-separated workload files"""
+import re
+import warnings
+from array import array
+from typing import Iterator, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional - integer columns fall back to int()
+    np = None
+
+# Characters read per block; a block ends on the last complete line
+DEFAULT_BLOCK_SIZE = 1 << 22
+
+# A sign followed by whitespace, which NumPy accepts and int() rejects
+SIGN_SPACE = re.compile(r'[+-]\s')
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+Columns = Tuple[List[str], array, array, array]
+
+
+def parse_lines(lines: List[str]) -> Columns:
+    """
+    Parse workload lines into columns
+    
+    Expected format: pid,arrival_time,burst_time,priority
+    Blank lines, lines starting with # and lines with fewer than four
+    fields are skipped; fields after the fourth are ignored. The valid
+    lines are joined and split once, so the integer columns are converted
+    in bulk rather than line by line.
+    
+    Returns:
+        Tuple of (pids, arrival times, burst times, priorities) with the
+        integer columns as int64 arrays
+    """
+    rows = [line for line in lines if line.count(',') == 3]
+    if len(rows) != len(lines):
+        # Irregular block: drop short lines and cut long ones to four fields
+        rows = [','.join(line.split(',', 4)[:4]) for line in lines if line.count(',') >= 3]
+    if any('#' in line for line in rows):
+        rows = [line for line in rows if not line.lstrip().startswith('#')]
+    if not rows:
+        return [], array('q'), array('q'), array('q')
+    fields = ','.join(rows).split(',')
+    return (
+        [pid.strip() for pid in fields[0::4]],
+        _int_column(fields[1::4]),
+        _int_column(fields[2::4]),
+        _int_column(fields[3::4])
+    )
+
+
+def _int_column(fields: List[str]) -> array:
+    """Convert integer fields to an int64 array, through NumPy's text parser when available"""
+    if np is not None:
+        text = ','.join(fields)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                values = np.fromstring(text, dtype=np.int64, sep=',')
+        except ValueError:
+            values = None
+        if (values is not None and len(values) == len(fields)
+                and _parsed_strictly(values, fields, text)):
+            column = array('q')
+            column.frombytes(values.tobytes())
+            return column
+    # Also reports malformed fields with int()'s usual error
+    return array('q', map(int, fields))
+
+
+def _parsed_strictly(values, fields: List[str], text: str) -> bool:
+    """Whether NumPy read every field as int() would; its text parser is laxer in a few cases"""
+    # Out-of-range fields saturate at the int64 limits instead of failing
+    if (values == INT64_MIN).any() or (values == INT64_MAX).any():
+        return False
+    if ('-' in text or '+' in text) and SIGN_SPACE.search(text):
+        return False
+    # Empty, blank and lone-sign fields come out as 0
+    try:
+        for position in np.flatnonzero(values == 0).tolist():
+            int(fields[position])
+    except ValueError:
+        return False
+    return True
+
+
+def iter_columns(filepath: str, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[Columns]:
+    """
+    Parse a workload file block by block
+    
+    Args:
+        filepath: Path of the comma-separated workload file
+        block_size: Characters to read per block
+    
+    Returns:
+        Iterator of column tuples (see parse_lines), one per non-empty block
+    """
+    carry = ''
+    with open(filepath, 'r') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            block = carry + block
+            cut = block.rfind('\n') + 1
+            carry = block[cut:]
+            # Text mode already made line endings '\n'; splitlines() would split on \f, \v... too
+            columns = parse_lines(block[:cut].split('\n'))
+            if columns[0]:
+                yield columns
+    if carry:
+        columns = parse_lines([carry])
+        if columns[0]:
+            yield columns
+
+
+def read_columns(filepath: str, block_size: int = DEFAULT_BLOCK_SIZE) -> Columns:
+    """Parse a whole workload file into one set of columns"""
+    pids, arrival, burst, priority = [], array('q'), array('q'), array('q')
+    for chunk in iter_columns(filepath, block_size):
+        pids.extend(chunk[0])
+        arrival.extend(chunk[1])
+        burst.extend(chunk[2])
+        priority.extend(chunk[3])
+    return pids, arrival, burst, priority